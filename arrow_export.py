@@ -0,0 +1,196 @@
+"""
+Analiz hatları için sütunlu çıktı: yorumlar/değerlendirmeler tipli sütunlarla Parquet veya
+Arrow IPC dosyasına satır grupları halinde yazılır; çok ürünlük çekimler hive bölümlü bir
+Parquet veri kümesine eklenebilir (scrape_mode=.../product_key=...)
+"""
+
+import json
+import os
+import re
+import time
+import uuid
+from datetime import date, datetime, timezone
+from urllib.parse import quote
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+DEFAULT_ROW_GROUP_SIZE = 50000
+
+# Az sayıda farklı değer alan sütunlar sözlük kodlanır
+DICTIONARY_COLUMNS = ('url', 'product_name', 'seller', 'product', 'user', 'date')
+
+_DOTTED_DATE = re.compile(r'^(\d{1,2})\.(\d{1,2})\.(\d{4})')
+_ISO_DATE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})')
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Parquet/Arrow çıktısı için pyarrow gerekli: pip install pyarrow")
+
+
+def schema():
+    """Her iki mod için ortak şema; yorumlarda seller/product boş kalır, kullanıcı 'user' sütunundadır"""
+    _require_pyarrow()
+    text_dict = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ('url', text_dict),
+        ('product_name', text_dict),
+        ('seller', text_dict),
+        ('product', text_dict),
+        ('user', text_dict),
+        ('comment', pa.string()),
+        ('date', text_dict),
+        ('date_parsed', pa.date32()),
+        ('rating', pa.int8()),
+        ('review_id', pa.string()),
+        ('scraped_at', pa.timestamp('s', tz='UTC')),
+    ])
+
+
+def parse_date(value):
+    """'12.03.2024' veya '2024-03-12...' biçimindeki tarihi date'e çevirir, olmazsa None"""
+    if not value:
+        return None
+    match = _DOTTED_DATE.match(value)
+    try:
+        if match:
+            return date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+        match = _ISO_DATE.match(value)
+        if match:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        pass
+    return None
+
+
+def _parse_rating(value):
+    try:
+        rating = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    return rating if 0 <= rating <= 127 else None
+
+
+class _DictionaryEncoder:
+    """Satır grupları boyunca büyüyen sözlük; her grup öncekinin uzantısı olduğundan
+    IPC dosyasına delta olarak yazılabilir"""
+
+    def __init__(self):
+        self._positions = {}
+        self._values = []
+
+    def encode(self, values):
+        indices = []
+        for value in values:
+            if value is None:
+                indices.append(None)
+                continue
+            position = self._positions.get(value)
+            if position is None:
+                position = self._positions[value] = len(self._values)
+                self._values.append(value)
+            indices.append(position)
+        return pa.DictionaryArray.from_arrays(pa.array(indices, type=pa.int32()), pa.array(self._values, type=pa.string()))
+
+
+class _BatchBuilder:
+    def __init__(self, product_info, mode, url=None):
+        self.mode = mode
+        self.url = url
+        self.product_name = (product_info or {}).get('name')
+        self.scraped_at = datetime.now(timezone.utc).replace(microsecond=0)
+        self.schema = schema()
+        self._encoders = {column: _DictionaryEncoder() for column in DICTIONARY_COLUMNS}
+
+    def build(self, records):
+        user_field = 'name' if self.mode == 'reviews' else 'user'
+        columns = {
+            'url': [self.url] * len(records),
+            'product_name': [self.product_name] * len(records),
+            'seller': [record.get('seller') for record in records],
+            'product': [record.get('product') for record in records],
+            'user': [record.get(user_field) for record in records],
+            'date': [record.get('date') for record in records],
+        }
+
+        arrays = {column: self._encoders[column].encode(values) for column, values in columns.items()}
+        arrays['comment'] = pa.array([record.get('comment') for record in records], type=pa.string())
+        arrays['date_parsed'] = pa.array([parse_date(value) for value in columns['date']], type=pa.date32())
+        arrays['rating'] = pa.array([_parse_rating(record.get('rating')) for record in records], type=pa.int8())
+        arrays['review_id'] = pa.array([record.get('review_id') for record in records], type=pa.string())
+        arrays['scraped_at'] = pa.array([self.scraped_at] * len(records), type=pa.timestamp('s', tz='UTC'))
+
+        return pa.RecordBatch.from_arrays([arrays[field.name] for field in self.schema], schema=self.schema)
+
+
+def _metadata(product_info, mode, url):
+    return {
+        'scrape_mode': mode,
+        'url': url or '',
+        'product_info': json.dumps(product_info or {}, ensure_ascii=False),
+        'exported_at': str(int(time.time())),
+    }
+
+
+def _batches(records, product_info, mode, url, row_group_size):
+    builder = _BatchBuilder(product_info, mode, url)
+    for start in range(0, len(records), row_group_size):
+        yield builder.build(records[start:start + row_group_size])
+
+
+def export_parquet(filename, product_info, records, mode='comments', url=None,
+                   row_group_size=DEFAULT_ROW_GROUP_SIZE, compression='zstd'):
+    """Kayıtları row_group_size'lık satır grupları halinde Parquet dosyasına yazar; ürün bilgisi şema metadata'sındadır"""
+    _require_pyarrow()
+    file_schema = schema().with_metadata(_metadata(product_info, mode, url))
+
+    with pq.ParquetWriter(filename, file_schema, compression=compression, use_dictionary=True) as writer:
+        for batch in _batches(records, product_info, mode, url, row_group_size):
+            writer.write_batch(batch, row_group_size=row_group_size)
+    return filename
+
+
+def export_ipc(filename, product_info, records, mode='comments', url=None, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+    """Kayıtları Arrow IPC (Feather v2) dosyasına parti parti yazar"""
+    _require_pyarrow()
+    file_schema = schema().with_metadata(_metadata(product_info, mode, url))
+    options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+
+    with pa.OSFile(filename, 'wb') as sink, pa.ipc.new_file(sink, file_schema, options=options) as writer:
+        for batch in _batches(records, product_info, mode, url, row_group_size):
+            writer.write_batch(batch)
+    return filename
+
+
+def product_key(product_info, url=None):
+    """Bölüm dizini için ürün anahtarı: URL'deki -p-<id> varsa o, yoksa ürün adı"""
+    match = re.search(r'-p-(\d+)', url or '')
+    if match:
+        return match.group(1)
+    return (product_info or {}).get('name') or 'bilinmiyor'
+
+
+def append_to_dataset(root, product_info, records, mode='comments', url=None, key=None,
+                      row_group_size=DEFAULT_ROW_GROUP_SIZE, compression='zstd'):
+    """Kayıtları root altındaki hive bölümlü veri kümesine yeni bir dosya olarak ekler.
+
+    Yol: root/scrape_mode=<mod>/product_key=<anahtar>/part-<zaman>-<uuid>.parquet; mevcut dosyalara
+    dokunulmaz, pyarrow.dataset.dataset(root, partitioning='hive') ile tümü birlikte okunur.
+    """
+    _require_pyarrow()
+    key = key or product_key(product_info, url)
+    directory = os.path.join(root, f"scrape_mode={quote(mode, safe='')}", f"product_key={quote(str(key), safe='')}")
+    os.makedirs(directory, exist_ok=True)
+
+    filename = os.path.join(directory, f"part-{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet")
+    # Okuyucular yarım dosya görmesin: '.' ile başlayan dosyalar veri kümesi taramasında atlanır
+    temp_path = os.path.join(directory, f".{os.path.basename(filename)}.tmp")
+    export_parquet(temp_path, product_info, records, mode, url=url, row_group_size=row_group_size, compression=compression)
+    os.replace(temp_path, filename)
+    return filename
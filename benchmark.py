@@ -0,0 +1,199 @@
+"""
+Canlı siteye gitmeden çekim hızını ölçen benchmark: sentetik fixture sayfaları (bkz. fixtures.py)
+headless Chrome ile her çekim yolunda çalıştırılır; kayıt/sn, kayıt başına WebDriver çağrısı
+ve en yüksek bellek (RSS) raporlanır.
+
+Kullanım:
+    python benchmark.py --sizes 10 1000 10000 50000 --paths jsonld snapshot script prune elements
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import threading
+import time
+
+from browser_pool import BrowserPool
+from fixtures import write_fixture
+from trendyol_scraper import TrendyolScraper
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# Yol adı -> (TrendyolScraper argümanları, HTML'e zorlamak için max_comments verilsin mi)
+PATHS = {
+    'jsonld': ({'extraction_engine': 'snapshot'}, False),
+    'snapshot': ({'extraction_engine': 'snapshot'}, True),
+    'script': ({'extraction_engine': 'script'}, True),
+    'prune': ({'extraction_engine': 'script', 'prune_dom': True}, True),
+    'elements': ({'extraction_engine': 'elements'}, True),
+}
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 50000)
+
+
+class _RssSampler(threading.Thread):
+    """Chrome oturumunun (chromedriver + alt süreçler) ve bu sürecin en yüksek RSS'ini örnekler"""
+
+    def __init__(self, driver, interval=0.05):
+        super().__init__(daemon=True)
+        self.driver = driver
+        self.interval = interval
+        self.chrome_peak_mb = None
+        self.python_peak_mb = None
+        self._stopped = threading.Event()
+
+    def run(self):
+        own = psutil.Process() if psutil else None
+        while not self._stopped.is_set():
+            chrome = BrowserPool.session_rss_mb(self.driver)
+            if chrome is not None:
+                self.chrome_peak_mb = max(self.chrome_peak_mb or 0, chrome)
+            if own is not None:
+                self.python_peak_mb = max(self.python_peak_mb or 0, own.memory_info().rss / (1024 * 1024))
+            self._stopped.wait(self.interval)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+class InstrumentedScraper(TrendyolScraper):
+    """Her WebDriver komutunu sayan ve oturum belleğini örnekleyen scraper"""
+
+    # Statik fixture'da tembel yükleme yok; boş scroll beklemeleri kısa tutulur
+    SCROLL_INITIAL_TIMEOUT = 0.3
+
+    def __init__(self, *args, fixture_size=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fixture_size = fixture_size
+        self.webdriver_calls = 0
+        self.sampler = None
+
+    def _scroll_until_loaded(self, item_selector, scroll_container, noun, expected_total=None, **kwargs):
+        # Değerlendirme modunda JSON-LD toplamı kullanılmaz; fixture'daki sayı bilindiğinden liste sonundaki
+        # boş scroll beklemeleri çekim süresine (ve kayıt/sn'ye) girmesin
+        return super()._scroll_until_loaded(
+            item_selector, scroll_container, noun, expected_total=self.fixture_size or expected_total, **kwargs
+        )
+
+    def create_driver(self):
+        driver = super().create_driver()
+        execute = driver.execute
+
+        # WebElement çağrıları da driver.execute üzerinden geçer
+        def counted_execute(command, params=None):
+            self.webdriver_calls += 1
+            return execute(command, params)
+
+        driver.execute = counted_execute
+        self.sampler = _RssSampler(driver)
+        self.sampler.start()
+        return driver
+
+    def _scrape_product(self, url, scrape_mode):
+        try:
+            return super()._scrape_product(url, scrape_mode)
+        finally:
+            if self.sampler:
+                self.sampler.stop()
+
+
+def fixture_path(workdir, mode, size):
+    path = os.path.join(workdir, f"{mode}_{size}.html")
+    if not os.path.exists(path):
+        write_fixture(path, size, mode=mode)
+    return path
+
+
+def run_case(path_name, mode, size, workdir, quiet=True):
+    """Tek bir (yol, mod, boyut) ölçümü yapar ve sonuç sözlüğü döner"""
+    options, force_html = PATHS[path_name]
+    url = 'file://' + os.path.abspath(fixture_path(workdir, mode, size))
+
+    scraper = InstrumentedScraper(
+        headless=True, http_fast_path=False, max_comments=size if force_html else None, fixture_size=size, **options
+    )
+
+    started = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        with contextlib.redirect_stdout(devnull) if quiet else contextlib.nullcontext():
+            result = scraper.scrape_product(url, scrape_mode=mode)
+    wall = time.perf_counter() - started
+
+    extracted = result['total_reviews'] if mode == 'reviews' else result['total_comments']
+    phases = scraper.metrics.phases
+    work_seconds = phases['scroll'] + phases['expansion'] + phases['extraction']
+
+    return {
+        'path': path_name,
+        'mode': mode,
+        'size': size,
+        'extracted': extracted,
+        'wall_seconds': wall,
+        'work_seconds': work_seconds,
+        'reviews_per_second': extracted / work_seconds if work_seconds else None,
+        'webdriver_calls': scraper.webdriver_calls,
+        'calls_per_review': scraper.webdriver_calls / extracted if extracted else None,
+        'chrome_peak_rss_mb': scraper.sampler.chrome_peak_mb if scraper.sampler else None,
+        'python_peak_rss_mb': scraper.sampler.python_peak_mb if scraper.sampler else None,
+        'phases': dict(phases),
+    }
+
+
+def _fmt(value, spec):
+    return '-' if value is None else format(value, spec)
+
+
+def print_row(row):
+    print(f"{row['path']:<9} {row['mode']:<9} {row['size']:>6} {row['extracted']:>6} "
+          f"{_fmt(row['wall_seconds'], '8.2f')} {_fmt(row['work_seconds'], '8.2f')} "
+          f"{_fmt(row['reviews_per_second'], '10.1f')} {_fmt(row['calls_per_review'], '9.3f')} "
+          f"{_fmt(row['chrome_peak_rss_mb'], '9.0f')} {_fmt(row['python_peak_rss_mb'], '8.0f')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik sayfalarla çevrimdışı çekim benchmark'ı")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--paths', nargs='+', choices=sorted(PATHS), default=list(PATHS))
+    parser.add_argument('--mode', choices=('comments', 'reviews'), default='comments')
+    parser.add_argument('--elements-limit', type=int, default=2000,
+                        help="element bazlı yolun çalıştırılacağı en büyük boyut (yavaş yol)")
+    parser.add_argument('--workdir', default='benchmark_fixtures')
+    parser.add_argument('--jsonl', help="sonuçların ekleneceği JSON lines dosyası")
+    parser.add_argument('--verbose', action='store_true', help="scraper çıktılarını gizleme")
+    args = parser.parse_args()
+
+    os.makedirs(args.workdir, exist_ok=True)
+    if psutil is None:
+        print("psutil yüklü değil, bellek ölçümleri boş kalacak")
+
+    print(f"{'yol':<9} {'mod':<9} {'boyut':>6} {'çekilen':>6} {'süre(s)':>8} {'çekim(s)':>8} "
+          f"{'kayıt/sn':>10} {'çağrı/kyt':>9} {'chromeMB':>9} {'pyMB':>8}")
+
+    for size in args.sizes:
+        for path_name in args.paths:
+            if path_name == 'jsonld' and args.mode == 'reviews':
+                continue
+            if path_name == 'elements' and size > args.elements_limit:
+                print(f"{path_name:<9} {args.mode:<9} {size:>6} atlandı (--elements-limit {args.elements_limit})")
+                continue
+
+            try:
+                row = run_case(path_name, args.mode, size, args.workdir, quiet=not args.verbose)
+            except Exception as e:
+                print(f"{path_name:<9} {args.mode:<9} {size:>6} hata: {str(e)}")
+                continue
+
+            print_row(row)
+            if args.jsonl:
+                with open(args.jsonl, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps({'timestamp': time.time(), **row}, ensure_ascii=False) + '\n')
+
+
+if __name__ == "__main__":
+    main()
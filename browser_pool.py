@@ -0,0 +1,175 @@
+"""
+Birden fazla scrape_product çağrısı arasında Chrome oturumlarını yeniden kullanan havuz
+"""
+
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class _PooledSession:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.time()
+
+
+class BrowserPool:
+    """Sıcak Chrome oturumlarını ödünç verir; işler arasında çerez/depolama temizlenir,
+    oturumlar N sayfadan veya M MB bellekten sonra yenilenir.
+
+    Kullanım:
+        with BrowserPool(headless=True, size=2) as pool:
+            scraper = TrendyolScraper(headless=True, pool=pool)
+            scraper.scrape_product(url)
+    """
+
+    def __init__(self, headless=True, size=1, max_pages=50, max_rss_mb=1500, driver_factory=None):
+        self.headless = headless
+        self.size = size
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+
+        if driver_factory is None:
+            from trendyol_scraper import TrendyolScraper
+            driver_factory = TrendyolScraper(headless=headless).create_driver
+        self.driver_factory = driver_factory
+
+        self._idle = []
+        self._in_use = {}
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def acquire(self, timeout=None):
+        """Sağlıklı bir oturum döner; havuz doluysa biri serbest kalana kadar bekler"""
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("BrowserPool kapatıldı")
+
+                while self._idle:
+                    session = self._idle.pop()
+                    if self._is_healthy(session):
+                        self._in_use[id(session.driver)] = session
+                        return session.driver
+                    print("Sağlıksız tarayıcı oturumu atıldı")
+                    self._quit(session)
+
+                if len(self._in_use) < self.size:
+                    break
+
+                if not self._condition.wait(timeout):
+                    raise TimeoutError("Havuzda boş tarayıcı oturumu yok")
+
+            # Oluşturma sırasında yer ayırmak için geçici kayıt
+            placeholder = object()
+            self._in_use[id(placeholder)] = placeholder
+
+        try:
+            print("Yeni tarayıcı oturumu açılıyor (havuz)")
+            session = _PooledSession(self.driver_factory())
+        except Exception:
+            with self._condition:
+                del self._in_use[id(placeholder)]
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            del self._in_use[id(placeholder)]
+            self._in_use[id(session.driver)] = session
+        return session.driver
+
+    def release(self, driver):
+        """Oturumu temizleyip havuza geri koyar ya da limitler aşıldıysa kapatır"""
+        with self._condition:
+            session = self._in_use.pop(id(driver), None)
+
+        if session is None:
+            driver.quit()
+            return
+
+        session.pages += 1
+        recycle = self._closed or session.pages >= self.max_pages
+
+        if not recycle:
+            rss_mb = self.session_rss_mb(session.driver)
+            if rss_mb is not None and rss_mb >= self.max_rss_mb:
+                print(f"Tarayıcı belleği {rss_mb:.0f} MB, oturum yenilenecek")
+                recycle = True
+
+        if not recycle and not self._reset(session):
+            recycle = True
+
+        if recycle:
+            self._quit(session)
+
+        with self._condition:
+            if not recycle:
+                self._idle.append(session)
+            self._condition.notify()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            sessions, self._idle = self._idle, []
+            self._condition.notify_all()
+
+        for session in sessions:
+            self._quit(session)
+
+    @staticmethod
+    def session_rss_mb(driver):
+        """chromedriver ve alt Chrome süreçlerinin toplam RSS'i (psutil yoksa None)"""
+        if psutil is None:
+            return None
+
+        try:
+            process = psutil.Process(driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _is_healthy(session):
+        try:
+            return session.driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(session):
+        """Çerezleri ve önbelleği tarayıcı genelinde, depolamayı (local/session storage, IndexedDB,
+        service worker, Cache Storage) açık sayfanın origin'i için CDP ile temizleyip boş sayfaya döner.
+
+        delete_all_cookies sadece açık alan adının çerezlerini sildiğinden CDN/API alan adlarındaki
+        çerezler sonraki işe taşınıyordu.
+        """
+        try:
+            origin = session.driver.execute_script("return window.location.origin;")
+            session.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            if origin and origin != 'null':
+                session.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+            session.driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+            session.driver.get("about:blank")
+            return True
+        except Exception as e:
+            print(f"Tarayıcı oturumu sıfırlanamadı: {str(e)}")
+            return False
+
+    @staticmethod
+    def _quit(session):
+        try:
+            session.driver.quit()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,109 @@
+"""
+python-docx nesne ağacı kurmadan WordprocessingML'i doğrudan zip içine akıtan hafif .docx yazıcı
+"""
+
+import io
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+# XML 1.0'da geçersiz kontrol karakterleri
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
+</Types>"""
+
+_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+_DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+# Stiller bir kez tanımlanır; her kayıt sadece stil adına referans verir
+_STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri" w:cs="Calibri"/><w:sz w:val="22"/></w:rPr></w:rPrDefault>
+<w:pPrDefault><w:pPr><w:spacing w:after="120" w:line="264" w:lineRule="auto"/></w:pPr></w:pPrDefault></w:docDefaults>
+<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/><w:basedOn w:val="Normal"/><w:pPr><w:jc w:val="center"/><w:spacing w:after="240"/></w:pPr><w:rPr><w:sz w:val="52"/></w:rPr></w:style>
+<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/><w:pPr><w:keepNext/><w:spacing w:before="360"/><w:outlineLvl w:val="0"/></w:pPr><w:rPr><w:b/><w:color w:val="2F5496"/><w:sz w:val="32"/></w:rPr></w:style>
+<w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/><w:basedOn w:val="Normal"/><w:pPr><w:keepNext/><w:spacing w:before="240"/><w:outlineLvl w:val="1"/></w:pPr><w:rPr><w:b/><w:color w:val="2F5496"/><w:sz w:val="26"/></w:rPr></w:style>
+<w:style w:type="paragraph" w:styleId="Heading3"><w:name w:val="heading 3"/><w:basedOn w:val="Normal"/><w:pPr><w:keepNext/><w:spacing w:before="200"/><w:outlineLvl w:val="2"/></w:pPr><w:rPr><w:b/><w:color w:val="1F3763"/><w:sz w:val="24"/></w:rPr></w:style>
+<w:style w:type="paragraph" w:styleId="Record"><w:name w:val="Record"/><w:basedOn w:val="Normal"/><w:pPr><w:pBdr><w:bottom w:val="single" w:sz="4" w:space="6" w:color="999999"/></w:pBdr></w:pPr></w:style>
+<w:style w:type="character" w:styleId="Label"><w:name w:val="Label"/><w:rPr><w:b/></w:rPr></w:style>
+</w:styles>"""
+
+_DOCUMENT_START = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                   '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>')
+
+_DOCUMENT_END = ('<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+                 '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" w:header="708" w:footer="708" w:gutter="0"/>'
+                 '</w:sectPr></w:body></w:document>')
+
+_HEADING_STYLES = {0: 'Title', 1: 'Heading1', 2: 'Heading2', 3: 'Heading3'}
+
+
+def _text_runs(text):
+    """Metni kaçışlayıp satır sonlarını <w:br/> ile koruyan run içeriği üretir"""
+    lines = _INVALID_XML_CHARS.sub('', str(text)).split('\n')
+    return '<w:br/>'.join(f'<w:t xml:space="preserve">{escape(line)}</w:t>' for line in lines)
+
+
+class DocxStreamWriter:
+    """Paragrafları doğrudan word/document.xml akışına yazar; bellekte belge ağacı tutmaz"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._zip = zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED)
+        self._zip.writestr('[Content_Types].xml', _CONTENT_TYPES)
+        self._zip.writestr('_rels/.rels', _ROOT_RELS)
+        self._zip.writestr('word/_rels/document.xml.rels', _DOCUMENT_RELS)
+        self._zip.writestr('word/styles.xml', _STYLES)
+
+        self._body = io.TextIOWrapper(
+            self._zip.open('word/document.xml', 'w', force_zip64=True), encoding='utf-8', write_through=False
+        )
+        self._body.write(_DOCUMENT_START)
+
+    def heading(self, text, level=1):
+        self._body.write(
+            f'<w:p><w:pPr><w:pStyle w:val="{_HEADING_STYLES[level]}"/></w:pPr><w:r>{_text_runs(text)}</w:r></w:p>'
+        )
+
+    def paragraph(self, text=''):
+        self._body.write(f'<w:p><w:r>{_text_runs(text)}</w:r></w:p>' if text else '<w:p/>')
+
+    def fields(self, pairs, style='Record'):
+        """(etiket, değer) çiftlerini tek paragrafta, satır sonlarıyla ayrılmış olarak yazar"""
+        runs = []
+        for idx, (label, value) in enumerate(pairs):
+            if idx:
+                runs.append('<w:r><w:br/></w:r>')
+            runs.append(f'<w:r><w:rPr><w:rStyle w:val="Label"/></w:rPr>{_text_runs(label)}</w:r>')
+            runs.append(f'<w:r>{_text_runs(value)}</w:r>')
+
+        style_xml = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ''
+        self._body.write(f'<w:p>{style_xml}{"".join(runs)}</w:p>')
+
+    def page_break(self):
+        self._body.write('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+
+    def close(self):
+        self._body.write(_DOCUMENT_END)
+        self._body.close()
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -3,6 +3,7 @@ Trendyol Scraper Kullanım Örnekleri
 """
 
 from trendyol_scraper import TrendyolScraper
+from browser_pool import BrowserPool
 from datetime import datetime
 
 
@@ -80,23 +81,25 @@ def example_3_multiple_products():
         # Daha fazla URL ekleyebilirsiniz
     ]
 
-    for idx, url in enumerate(urls, 1):
-        print(f"\n[{idx}/{len(urls)}] İşleniyor: {url}")
+    # Tek bir tarayıcı oturumu tüm ürünler için yeniden kullanılır
+    with BrowserPool(headless=True) as pool:
+        scraper = TrendyolScraper(headless=True, pool=pool)
 
-        scraper = TrendyolScraper(headless=True)
+        for idx, url in enumerate(urls, 1):
+            print(f"\n[{idx}/{len(urls)}] İşleniyor: {url}")
 
-        try:
-            result = scraper.scrape_product(url)
+            try:
+                result = scraper.scrape_product(url)
 
-            # Her ürün için ayrı dosya oluştur
-            product_name = result['product_info'].get('name', f'urun_{idx}')
-            safe_name = "".join(c for c in product_name if c.isalnum() or c in (' ', '-', '_'))[:50]
+                # Her ürün için ayrı dosya oluştur
+                product_name = result['product_info'].get('name', f'urun_{idx}')
+                safe_name = "".join(c for c in product_name if c.isalnum() or c in (' ', '-', '_'))[:50]
 
-            scraper.export_to_pdf(f"{safe_name}.pdf")
-            print(f"✓ {result['total_comments']} yorum kaydedildi")
+                scraper.export_to_pdf(f"{safe_name}.pdf")
+                print(f"✓ {result['total_comments']} yorum kaydedildi")
 
-        except Exception as e:
-            print(f"✗ Hata: {str(e)}")
+            except Exception as e:
+                print(f"✗ Hata: {str(e)}")
 
 
 def example_4_custom_analysis():
@@ -0,0 +1,157 @@
+"""
+Trendyol benzeri sentetik ürün sayfaları: scraper'ın dayandığı işaretleme (div.review,
+span.review-comment, .review-list .review, .item-header .seller, JSON-LD Product/Review)
+ve "Devamını oku" ile açılan uzun yorumlar
+"""
+
+import json
+import random
+from xml.sax.saxutils import escape
+
+_WORDS = (
+    "ürün kargo hızlı geldi kaliteli fiyat performans beden tam oldu rengi fotoğraftaki gibi "
+    "paketleme özenliydi satıcı ilgili tavsiye ederim kumaşı ince biraz küçük kalıp iade "
+    "sorunsuz teşekkürler beklediğimden güzel günlük kullanım için ideal pil ömrü uzun"
+).split()
+
+_NAMES = ("A*** Y***", "M*** K***", "E*** D***", "S*** T***", "Z*** A***", "B*** Ç***", "Ö*** Ş***")
+_SELLERS = ("Moda Evi", "Teknoloji Dünyası", "Ev & Yaşam", "Spor Market", "Kitap Kurdu")
+_PRODUCTS = ("Kol Saati", "Kulaklık", "Tişört", "Termos", "Sırt Çantası", "Telefon Kılıfı", "Masa Lambası")
+
+# Kısaltılmış yorumdan uzun olanlar "Devamını oku" ile açılır
+SHORT_COMMENT_CHARS = 120
+
+# Tıklanınca data-full'daki metni yerleştiren küçük betik (sitedeki genişletme davranışının taklidi)
+_EXPAND_SCRIPT = """
+document.addEventListener('click', function (event) {
+    var trigger = event.target.closest('.read-more');
+    if (!trigger) return;
+    var comment = trigger.parentNode.querySelector('.review-comment, .comment');
+    comment.textContent = comment.getAttribute('data-full');
+    trigger.remove();
+});
+"""
+
+
+def synthetic_review(idx, seed=42, long_ratio=0.2):
+    """idx'inci sahte yorum; aynı (seed, idx) her zaman aynı yorumu üretir (sunucu sayfalaması için)"""
+    rng = random.Random(f"{seed}:{idx}")
+    length = rng.randint(40, 90) if rng.random() < long_ratio else rng.randint(4, 18)
+    return {
+        'id': idx + 1,
+        'user': rng.choice(_NAMES),
+        'comment': ' '.join(rng.choice(_WORDS) for _ in range(length)).capitalize() + f". #{idx}",
+        'date': f"{rng.randint(1, 28)}.{rng.randint(1, 12):02d}.{rng.choice((2023, 2024, 2025))}",
+        'rating': rng.randint(1, 5),
+        'seller': rng.choice(_SELLERS),
+        'product': rng.choice(_PRODUCTS),
+    }
+
+
+def synthetic_reviews(count, seed=42, long_ratio=0.2, start=0):
+    """Deterministik sahte yorum listesi; long_ratio oranında yorum kısaltma sınırını aşar"""
+    return [synthetic_review(idx, seed, long_ratio) for idx in range(start, start + count)]
+
+
+def _comment_text(text, field_class):
+    if len(text) <= SHORT_COMMENT_CHARS:
+        return f'<span class="{field_class}">{escape(text)}</span>'
+    return (f'<span class="{field_class}" data-full="{escape(text, {chr(34): "&quot;"})}">'
+            f'{escape(text[:SHORT_COMMENT_CHARS])}...</span> <span class="read-more">Devamını oku</span>')
+
+
+def render_comment(review):
+    """Ürün yorumu kartı (COMMENT_ITEM_SELECTOR / COMMENT_FIELD_SELECTORS)"""
+    return (
+        '<div class="review">'
+        f'<div class="comment-info"><span class="name">{escape(review["user"])}</span>'
+        f'<span class="date">{escape(review["date"])}</span></div>'
+        f'<div class="comment-text">{_comment_text(review["comment"], "review-comment")}</div>'
+        '</div>'
+    )
+
+
+def render_review(review):
+    """Mağaza değerlendirmesi kartı (REVIEW_ITEM_SELECTOR / REVIEW_FIELD_SELECTORS)"""
+    return (
+        '<div class="review">'
+        f'<div class="item-header"><span class="seller">{escape(review["seller"])}</span>'
+        f'<span class="product">{escape(review["product"])}</span></div>'
+        '<div class="review-info">'
+        f'<div class="name-wrapper">{_comment_text(review["comment"], "comment")}</div>'
+        f'<div class="review-info-detail"><span class="name">{escape(review["user"])}</span>'
+        f'<span class="date">{escape(review["date"])}</span></div>'
+        '</div></div>'
+    )
+
+
+def product_json_ld(reviews, name="Sentetik Test Ürünü", total=None, embed_reviews=True):
+    data = {
+        '@context': 'https://schema.org',
+        '@type': 'Product',
+        'name': name,
+        'aggregateRating': {
+            '@type': 'AggregateRating',
+            'ratingValue': 4.3,
+            'ratingCount': total if total is not None else len(reviews),
+            'reviewCount': total if total is not None else len(reviews),
+        },
+    }
+    if embed_reviews:
+        data['review'] = [
+            {
+                '@type': 'Review',
+                'author': {'@type': 'Person', 'name': review['user']},
+                'reviewBody': review['comment'],
+                'datePublished': review['date'],
+                'reviewRating': {'@type': 'Rating', 'ratingValue': review['rating']},
+            }
+            for review in reviews
+        ]
+    # </script> kaçışı: JSON içinde "</" geçmemeli
+    return json.dumps(data, ensure_ascii=False).replace('</', '<\\/')
+
+
+def render_page(reviews, mode='comments', total=None, embed_reviews=True, scroll_container=True, extra_head='', extra_body=''):
+    """Tam ürün sayfası HTML'i.
+
+    mode='comments': sayfanın üstünde (scraper'ın atladığı) iki özet kartı ve ardından yorum kartları
+    mode='reviews': .review-list (scroll_container ise .review-list-scroll-container içinde) değerlendirme kartları
+    """
+    if mode == 'reviews':
+        cards = ''.join(render_review(review) for review in reviews)
+        review_list = f'<div class="review-list">{cards}</div>'
+        if scroll_container:
+            review_list = (f'<div class="review-list-scroll-container" style="height:800px;overflow-y:auto">'
+                           f'{review_list}</div>')
+    else:
+        summary = ('<div class="review"><span class="review-comment">Değerlendirme özeti</span></div>'
+                   '<div class="review"><span class="review-comment">Fotoğraflı yorumlar</span></div>')
+        review_list = f'<div class="reviews">{summary}{"".join(render_comment(review) for review in reviews)}</div>'
+
+    return f"""<!DOCTYPE html>
+<html lang="tr">
+<head>
+<meta charset="utf-8">
+<title>Sentetik Trendyol Ürünü</title>
+<script type="application/ld+json">{product_json_ld(reviews, total=total, embed_reviews=embed_reviews)}</script>
+<script>{_EXPAND_SCRIPT}</script>
+{extra_head}
+</head>
+<body>
+<div class="info-title-row"><h1 class="pr-new-br">Sentetik Test Ürünü</h1></div>
+<div class="rating-score"><span>4.3</span></div>
+<a href="#comments">Yorumlar</a>
+<div id="comments">{review_list}</div>
+{extra_body}
+</body>
+</html>
+"""
+
+
+def write_fixture(path, count, mode='comments', seed=42, embed_reviews=True):
+    """count yorumluk sayfayı path'e yazar ve üretilen yorumları döner"""
+    reviews = synthetic_reviews(count, seed=seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(render_page(reviews, mode=mode, embed_reviews=embed_reviews))
+    return reviews
@@ -1,30 +1,33 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import sys
-from io import StringIO
+import queue
 import threading
 from datetime import datetime
 from trendyol_scraper import TrendyolScraper
+from result_cache import ResultCache
 
 
 class LogRedirector:
-    """Terminal çıktılarını GUI'ye yönlendirir"""
-    def __init__(self, text_widget):
-        self.text_widget = text_widget
-        self.buffer = StringIO()
+    """Terminal çıktılarını GUI kuyruğuna yönlendirir; widget'a sadece ana thread yazar"""
+    def __init__(self, log_queue):
+        self.log_queue = log_queue
 
     def write(self, string):
-        self.text_widget.config(state='normal')
-        self.text_widget.insert(tk.END, string)
-        self.text_widget.see(tk.END)
-        self.text_widget.config(state='disabled')
-        self.text_widget.update_idletasks()
+        if string:
+            self.log_queue.put(('log', string, None))
 
     def flush(self):
         pass
 
 
 class TrendyolScraperGUI:
+    # Log kuyruğu bu aralıkla boşaltılır; tek turda en fazla LOG_BATCH_LIMIT mesaj işlenir
+    LOG_POLL_MS = 100
+    LOG_BATCH_LIMIT = 2000
+    # Log alanında tutulan en fazla satır; eskiler silinir
+    LOG_MAX_LINES = 5000
+
     def __init__(self, root):
         self.root = root
         self.root.title("Trendyol Scraper - Mavi Tema")
@@ -47,9 +50,13 @@ class TrendyolScraperGUI:
         self.scraper = None
         self.result = None
         self.is_scraping = False
+        self.cache = ResultCache()
+        # Scraper thread'i sadece bu kuyruğa yazar; Tk'ya ana thread'deki pump_events dokunur
+        self.events = queue.Queue()
 
         self.setup_ui()
         self.redirect_output()
+        self.root.after(self.LOG_POLL_MS, self.pump_events)
 
     def setup_ui(self):
         """Ana UI bileşenlerini oluşturur"""
@@ -191,7 +198,21 @@ class TrendyolScraperGUI:
             activebackground='white',
             selectcolor=self.colors['light']
         )
-        headless_cb.pack(anchor='w', pady=(0, 30))
+        headless_cb.pack(anchor='w', pady=(0, 10))
+
+        # Önbelleği atla checkbox
+        self.force_refresh_var = tk.BooleanVar(value=False)
+        force_refresh_cb = tk.Checkbutton(
+            control_frame,
+            text="🔄 Önbelleği yok say (yeniden çek)",
+            variable=self.force_refresh_var,
+            font=('Segoe UI', 10),
+            bg='white',
+            fg=self.colors['text'],
+            activebackground='white',
+            selectcolor=self.colors['light']
+        )
+        force_refresh_cb.pack(anchor='w', pady=(0, 30))
 
         # Başlat butonu
         self.start_button = tk.Button(
@@ -208,6 +229,37 @@ class TrendyolScraperGUI:
         )
         self.start_button.pack(fill='x', pady=(0, 10), ipady=12)
 
+        # İptal butonu
+        self.cancel_button = tk.Button(
+            control_frame,
+            text="⛔ İptal Et",
+            font=('Segoe UI', 11, 'bold'),
+            bg='gray',
+            fg='white',
+            activebackground='#B91C1C',
+            activeforeground='white',
+            relief='flat',
+            cursor='hand2',
+            state='disabled',
+            command=self.cancel_scraping
+        )
+        self.cancel_button.pack(fill='x', pady=(0, 10), ipady=8)
+
+        # İlerleme çubuğu ve hız/kalan süre etiketi
+        self.progress_bar = ttk.Progressbar(control_frame, mode='determinate', maximum=100)
+        self.progress_bar.pack(fill='x', pady=(0, 5))
+
+        self.progress_label = tk.Label(
+            control_frame,
+            text="",
+            font=('Segoe UI', 9),
+            bg='white',
+            fg=self.colors['text'],
+            anchor='w',
+            justify='left'
+        )
+        self.progress_label.pack(fill='x', pady=(0, 10))
+
         # Word Export butonu
         self.word_button = tk.Button(
             control_frame,
@@ -302,31 +354,62 @@ class TrendyolScraperGUI:
 
     def redirect_output(self):
         """Terminal çıktılarını log paneline yönlendir"""
-        sys.stdout = LogRedirector(self.log_text)
-        sys.stderr = LogRedirector(self.log_text)
+        sys.stdout = LogRedirector(self.events)
+        sys.stderr = LogRedirector(self.events)
 
     def log(self, message, level='info'):
-        """Log mesajı ekle"""
+        """Log mesajı ekle (her thread'den çağrılabilir)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
+        tag = level if level in ('success', 'error', 'warning') else 'info'
+        self.events.put(('log', f"[{timestamp}] {message}\n", tag))
+
+    def call_in_ui(self, func, *args):
+        """Tk çağrısını ana thread'de çalıştırılmak üzere kuyruğa ekler"""
+        self.events.put(('call', func, args))
+
+    def pump_events(self):
+        """Kuyruktaki mesajları toplu olarak log alanına yazar, UI çağrılarını sırayla çalıştırır"""
+        chunks = []
+        try:
+            for _ in range(self.LOG_BATCH_LIMIT):
+                kind, first, second = self.events.get_nowait()
+                if kind == 'log':
+                    # Aynı etiketli ardışık mesajlar tek insert'te birleştirilir
+                    if chunks and chunks[-1][1] == second:
+                        chunks[-1][0].append(first)
+                    else:
+                        chunks.append(([first], second))
+                else:
+                    self.write_log_chunks(chunks)
+                    chunks = []
+                    first(*second)
+        except queue.Empty:
+            pass
+        finally:
+            self.write_log_chunks(chunks)
+            self.root.after(self.LOG_POLL_MS, self.pump_events)
+
+    def write_log_chunks(self, chunks):
+        if not chunks:
+            return
 
         self.log_text.config(state='normal')
+        for parts, tag in chunks:
+            if tag:
+                self.log_text.insert(tk.END, ''.join(parts), tag)
+            else:
+                self.log_text.insert(tk.END, ''.join(parts))
 
-        if level == 'success':
-            self.log_text.insert(tk.END, formatted_message, 'success')
-        elif level == 'error':
-            self.log_text.insert(tk.END, formatted_message, 'error')
-        elif level == 'warning':
-            self.log_text.insert(tk.END, formatted_message, 'warning')
-        else:
-            self.log_text.insert(tk.END, formatted_message, 'info')
+        excess = int(self.log_text.index('end-1c').split('.')[0]) - self.LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
 
         self.log_text.see(tk.END)
         self.log_text.config(state='disabled')
 
     def update_status(self, text, color):
-        """Status label'ı güncelle"""
-        self.status_label.config(text=f"● {text}", fg=color)
+        """Status label'ı güncelle (her thread'den çağrılabilir)"""
+        self.call_in_ui(self.status_label.config, {'text': f"● {text}", 'fg': color})
 
     def clear_logs(self):
         """Log alanını temizle"""
@@ -368,48 +451,61 @@ class TrendyolScraperGUI:
         if not self.validate_inputs():
             return
 
-        # Thread içinde çalıştır
-        thread = threading.Thread(target=self.run_scraping)
-        thread.daemon = True
-        thread.start()
+        # Parametreler widget'lardan ana thread'de okunur
+        url = self.url_entry.get().strip()
+        scrape_mode = self.scrape_mode.get()
+        headless = self.headless_var.get()
+        force_refresh = self.force_refresh_var.get()
 
-    def run_scraping(self):
-        """Scraping işlemini çalıştır (thread içinde)"""
-        try:
-            self.is_scraping = True
-            self.update_status("Çalışıyor...", self.colors['warning'])
+        max_comments_text = self.max_comments_entry.get().strip()
+        max_comments = None
+        if max_comments_text and max_comments_text != "Boş bırakırsanız tümünü çeker":
+            max_comments = int(max_comments_text)
 
-            # Butonları devre dışı bırak
-            self.start_button.config(state='disabled', bg='gray')
-            self.word_button.config(state='disabled', bg='gray')
+        # Scraper ana thread'de oluşturulur; iptal butonu açıldığında self.scraper hazırdır
+        self.scraper = TrendyolScraper(
+            headless=headless, max_comments=max_comments, cache=self.cache,
+            progress_callback=lambda event: self.call_in_ui(self.show_progress, event)
+        )
+
+        self.is_scraping = True
+        self.update_status("Çalışıyor...", self.colors['warning'])
 
-            # Parametreleri al
-            url = self.url_entry.get().strip()
-            scrape_mode = self.scrape_mode.get()
-            headless = self.headless_var.get()
+        # Butonları devre dışı bırak
+        self.start_button.config(state='disabled', bg='gray')
+        self.word_button.config(state='disabled', bg='gray')
+        self.cancel_button.config(state='normal', bg=self.colors['error'])
+        self.progress_bar.stop()
+        self.progress_bar.config(mode='determinate', value=0)
+        self.progress_label.config(text="")
 
-            max_comments_text = self.max_comments_entry.get().strip()
-            max_comments = None
-            if max_comments_text and max_comments_text != "Boş bırakırsanız tümünü çeker":
-                max_comments = int(max_comments_text)
+        # Thread içinde çalıştır
+        thread = threading.Thread(
+            target=self.run_scraping, args=(self.scraper, url, scrape_mode, force_refresh)
+        )
+        thread.daemon = True
+        thread.start()
 
-            # Scraper oluştur
+    def run_scraping(self, scraper, url, scrape_mode, force_refresh):
+        """Scraping işlemini çalıştır (thread içinde); Tk'ya sadece kuyruk üzerinden dokunur"""
+        try:
             self.log("="*60, 'info')
             self.log(f"🚀 Scraping başlatılıyor...", 'info')
             self.log(f"URL: {url}", 'info')
             self.log(f"Mod: {scrape_mode}", 'info')
-            self.log(f"Headless: {headless}", 'info')
-            self.log(f"Maksimum: {max_comments if max_comments else 'Tümü'}", 'info')
+            self.log(f"Headless: {scraper.headless}", 'info')
+            self.log(f"Maksimum: {scraper.max_comments if scraper.max_comments else 'Tümü'}", 'info')
             self.log("="*60, 'info')
 
-            self.scraper = TrendyolScraper(headless=headless, max_comments=max_comments)
-
             # Scraping yap
-            self.result = self.scraper.scrape_product(url, scrape_mode=scrape_mode)
+            self.result = scraper.scrape_product(url, scrape_mode=scrape_mode, force_refresh=force_refresh)
 
             # Başarılı
             self.log("="*60, 'success')
-            self.log(f"✓ İşlem tamamlandı!", 'success')
+            if scraper.cancelled:
+                self.log("⛔ İşlem iptal edildi, toplanan kayıtlar korundu", 'warning')
+            else:
+                self.log(f"✓ İşlem tamamlandı!", 'success')
 
             if scrape_mode == 'reviews':
                 self.log(f"✓ Toplam {self.result['total_reviews']} değerlendirme çekildi", 'success')
@@ -420,18 +516,67 @@ class TrendyolScraperGUI:
             self.log("="*60, 'success')
 
             # Export butonunu aktif et
-            self.word_button.config(state='normal', bg=self.colors['success'])
+            self.call_in_ui(self.word_button.config, {'state': 'normal', 'bg': self.colors['success']})
 
-            self.update_status("Tamamlandı", self.colors['success'])
+            if scraper.cancelled:
+                self.update_status("İptal edildi", self.colors['warning'])
+            else:
+                self.update_status("Tamamlandı", self.colors['success'])
 
         except Exception as e:
             self.log(f"✗ HATA: {str(e)}", 'error')
             self.update_status("Hata!", self.colors['error'])
-            messagebox.showerror("Hata", f"Bir hata oluştu:\n{str(e)}")
+            self.call_in_ui(messagebox.showerror, "Hata", f"Bir hata oluştu:\n{str(e)}")
 
         finally:
             self.is_scraping = False
-            self.start_button.config(state='normal', bg=self.colors['secondary'])
+            self.call_in_ui(self.start_button.config, {'state': 'normal', 'bg': self.colors['secondary']})
+            self.call_in_ui(self.cancel_button.config, {'state': 'disabled', 'bg': 'gray'})
+
+    def cancel_scraping(self):
+        """Scroll'u durdurur; o ana kadar toplanan kayıtlar işlenip korunur"""
+        if not self.is_scraping or not self.scraper:
+            return
+
+        self.scraper.cancel()
+        self.log("⛔ İptal istendi, yüklenen kayıtlar işleniyor...", 'warning')
+        self.update_status("İptal ediliyor...", self.colors['warning'])
+
+    def show_progress(self, event):
+        """Scraper'dan gelen ilerleme olayını çubuk ve etikete yansıtır (ana thread)"""
+        target = event['target']
+        count = event['loaded'] if event['phase'] == 'scroll' else event['extracted']
+        rate = event['rate']
+
+        if target:
+            if str(self.progress_bar.cget('mode')) != 'determinate':
+                self.progress_bar.stop()
+                self.progress_bar.config(mode='determinate')
+            self.progress_bar.config(value=min(100, count * 100 / target))
+        elif event['phase'] != 'done' and str(self.progress_bar.cget('mode')) != 'indeterminate':
+            # Toplam bilinmiyorsa (ratingCount yok veya mağaza değerlendirmeleri) tahmin edilemez
+            self.progress_bar.config(mode='indeterminate')
+            self.progress_bar.start(15)
+
+        if event['phase'] == 'done':
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate', value=100)
+            self.progress_label.config(
+                text=f"{event['extracted']} kayıt, {event['elapsed']:.0f} sn"
+                     f"{' (iptal edildi)' if event['cancelled'] else ''}"
+            )
+            return
+
+        parts = []
+        if event['phase'] == 'scroll':
+            parts.append(f"Scroll #{event['scrolls']}: {count}{f'/{target}' if target else ''} yüklendi")
+        else:
+            parts.append(f"Çekiliyor: {count}{f'/{target}' if target else ''}")
+        parts.append(f"{rate:.1f} kayıt/sn")
+        if target and rate > 0 and count < target:
+            parts.append(f"kalan ~{(target - count) / rate:.0f} sn")
+
+        self.progress_label.config(text=" · ".join(parts))
 
     def export_word(self):
         """Word export"""
@@ -0,0 +1,100 @@
+"""
+Çekim başına aşama süreleri ve sayaçlar; JSON satırı veya Prometheus metin formatında dışa aktarılır
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+
+PHASES = ('driver_startup', 'navigation', 'product_info', 'scroll', 'expansion', 'extraction', 'export')
+COUNTERS = ('scrolls', 'elements_seen', 'duplicates', 'empty_reviews', 'errors')
+
+
+class ScrapeMetrics:
+    """Bir scrape_product çağrısının aşama sürelerini (saniye) ve olay sayaçlarını toplar"""
+
+    def __init__(self, url=None, scrape_mode=None):
+        self.url = url
+        self.scrape_mode = scrape_mode
+        self.started_at = time.time()
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.total_seconds = None
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        """Blok süresini ilgili aşamaya ekler; aynı aşama birden çok kez ölçülürse süreler toplanır"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def incr(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def stop(self):
+        self.total_seconds = time.perf_counter() - self._started
+
+    def to_dict(self):
+        return {
+            'timestamp': self.started_at,
+            'url': self.url,
+            'scrape_mode': self.scrape_mode,
+            'total_seconds': self.total_seconds,
+            'phases': dict(self.phases),
+            'counters': dict(self.counters),
+        }
+
+    def summary(self):
+        parts = [f"{name}={seconds:.2f}s" for name, seconds in self.phases.items() if seconds]
+        counters = [f"{name}={value}" for name, value in self.counters.items() if value]
+        return f"Süre dağılımı: {', '.join(parts) or '-'} | Sayaçlar: {', '.join(counters) or '-'}"
+
+    def write_jsonl(self, path):
+        """Çalıştırmayı dosyaya tek JSON satırı olarak ekler (çalıştırmalar arası karşılaştırma için)"""
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(self.to_dict(), ensure_ascii=False) + '\n')
+
+    def to_prometheus(self, prefix='trendyol_scraper'):
+        labels = f'mode="{_label(self.scrape_mode)}",url="{_label(self.url)}"'
+        lines = [
+            f"# HELP {prefix}_phase_seconds Aşama başına geçen süre",
+            f"# TYPE {prefix}_phase_seconds gauge",
+        ]
+        lines.extend(f'{prefix}_phase_seconds{{phase="{name}",{labels}}} {seconds:.6f}' for name, seconds in self.phases.items())
+
+        if self.total_seconds is not None:
+            lines.append(f"# TYPE {prefix}_total_seconds gauge")
+            lines.append(f"{prefix}_total_seconds{{{labels}}} {self.total_seconds:.6f}")
+
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total{{{labels}}} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path, prefix='trendyol_scraper'):
+        """node_exporter textfile collector için dosyayı atomik olarak yazar"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus(prefix))
+        os.replace(temp_path, path)
+
+
+def _label(value):
+    return str(value or '').replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def timed_phase(name):
+    """Metodun süresini self.metrics içindeki aşamaya ekleyen dekoratör"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.phase(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,192 @@
+"""
+Yorum ve değerlendirmeler için PDF çıktısı: stiller önbelleklenir, büyük çıktılar
+parçalar halinde süreç havuzunda üretilip tek dosyada birleştirilir
+"""
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.platypus.flowables import HRFlowable
+from reportlab.lib.enums import TA_LEFT
+from reportlab.lib.colors import black, grey
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
+
+
+@lru_cache(maxsize=None)
+def _styles():
+    styles = getSampleStyleSheet()
+
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=black,
+            spaceAfter=30,
+            alignment=TA_LEFT
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=black,
+            spaceAfter=12,
+            spaceBefore=12
+        ),
+        'normal': ParagraphStyle(
+            'CustomNormal',
+            parent=styles['Normal'],
+            fontSize=11,
+            leading=14,
+            alignment=TA_LEFT
+        ),
+    }
+
+
+# Flowable'lar yerleşim sırasında durum tutar (ör. _postponed); her kullanımda yeni örnek üretilir,
+# sadece stiller önbelleklenir
+def _small_gap():
+    return Spacer(1, 0.2 * inch)
+
+
+def _large_gap():
+    return Spacer(1, 0.3 * inch)
+
+
+def _separator():
+    return HRFlowable(width='100%', thickness=0.5, color=grey, spaceBefore=0.1 * inch, spaceAfter=0.2 * inch)
+
+
+def _text(value):
+    return escape(str(value))
+
+
+def build_entries(records, mode):
+    """Kayıtları yazım sırasındaki düz girdi listesine çevirir; değerlendirmeler ürüne göre alfabetik gruplanır"""
+    if mode != 'reviews':
+        return [('comment', idx, record) for idx, record in enumerate(records, 1)]
+
+    products_dict = {}
+    for review in records:
+        products_dict.setdefault(review.get('product', 'Bilinmiyor'), []).append(review)
+
+    entries = []
+    for product_name in sorted(products_dict.keys()):
+        product_reviews = products_dict[product_name]
+        entries.append(('product', product_name, len(product_reviews)))
+        entries.extend(('review', idx, review) for idx, review in enumerate(product_reviews, 1))
+    return entries
+
+
+def _header_story(product_info, mode, total):
+    styles = _styles()
+    story = []
+
+    story.append(Paragraph("Trendyol Ürün Değerlendirmeleri" if mode == 'reviews' else "Trendyol Ürün Yorumları", styles['title']))
+    story.append(_small_gap())
+
+    story.append(Paragraph("Ürün Bilgileri", styles['heading']))
+    for key, value in product_info.items():
+        story.append(Paragraph(f"<b>{_text(key.capitalize())}:</b> {_text(value)}", styles['normal']))
+
+    story.append(_small_gap())
+    if mode == 'reviews':
+        story.append(Paragraph(f"<b>Toplam Değerlendirme Sayısı:</b> {total}", styles['normal']))
+        story.append(_large_gap())
+        story.append(Paragraph("Değerlendirmeler (Ürünlere Göre Alfabetik)", styles['heading']))
+    else:
+        story.append(Paragraph(f"<b>Toplam Yorum Sayısı:</b> {total}", styles['normal']))
+        story.append(_large_gap())
+        story.append(Paragraph("Yorumlar", styles['heading']))
+    story.append(_small_gap())
+    return story
+
+
+def _entry_story(entries):
+    styles = _styles()
+    heading, normal = styles['heading'], styles['normal']
+    story = []
+
+    for kind, first, second in entries:
+        if kind == 'product':
+            story.append(Paragraph(f"📦 {_text(first)}", heading))
+            story.append(Paragraph(f"Bu ürüne ait {second} değerlendirme", normal))
+            story.append(_small_gap())
+        elif kind == 'review':
+            story.append(Paragraph(f"<b>Değerlendirme #{first}</b>", heading))
+            story.append(Paragraph(
+                f"<b>Satıcı:</b> {_text(second.get('seller', 'Bilinmiyor'))}<br/>"
+                f"<b>Kullanıcı:</b> {_text(second.get('name', 'Anonim'))}<br/>"
+                f"<b>Tarih:</b> {_text(second.get('date', 'Bilinmiyor'))}<br/>"
+                f"<b>Değerlendirme:</b> {_text(second.get('comment', ''))}",
+                normal
+            ))
+            story.append(_separator())
+        else:
+            story.append(Paragraph(f"<b>Yorum #{first}</b>", heading))
+            story.append(Paragraph(
+                f"<b>Kullanıcı:</b> {_text(second.get('user', 'Anonim'))}<br/>"
+                f"<b>Tarih:</b> {_text(second.get('date', 'Bilinmiyor'))}<br/>"
+                f"<b>Yorum:</b> {_text(second.get('comment', ''))}",
+                normal
+            ))
+            story.append(_separator())
+
+    return story
+
+
+def _render_chunk(filename, entries, product_info, mode, total, include_header):
+    story = _header_story(product_info, mode, total) if include_header else []
+    story.extend(_entry_story(entries))
+    SimpleDocTemplate(filename, pagesize=A4).build(story)
+    return filename
+
+
+def export_pdf(filename, product_info, records, mode='comments', workers=1, chunk_size=2000):
+    """Kayıtları PDF'e yazar.
+
+    workers > 1 ve pypdf yüklüyse girdiler chunk_size'lık parçalara bölünür, her parça ayrı
+    süreçte çizilir ve sonuçlar sırayla tek dosyada birleştirilir.
+    """
+    entries = build_entries(records, mode)
+    total = len(records)
+
+    if workers <= 1 or len(entries) <= chunk_size or PdfWriter is None:
+        if workers > 1 and PdfWriter is None:
+            print("pypdf yüklü değil, PDF tek süreçte oluşturulacak")
+        return _render_chunk(filename, entries, product_info, mode, total, include_header=True)
+
+    chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+    temp_dir = tempfile.mkdtemp(prefix='trendyol_pdf_')
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = [
+                executor.submit(
+                    _render_chunk, os.path.join(temp_dir, f"part_{idx:04d}.pdf"), chunk, product_info, mode, total, idx == 0
+                )
+                for idx, chunk in enumerate(chunks)
+            ]
+            parts = [future.result() for future in futures]
+
+        writer = PdfWriter()
+        for part in parts:
+            writer.append(part)
+        with open(filename, 'wb') as output:
+            writer.write(output)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return filename
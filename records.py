@@ -0,0 +1,106 @@
+"""
+Yorum ve değerlendirmeler için sözlük yerine kullanılan hafif, __slots__'lu kayıt tipleri.
+
+Kayıtlar salt okunur Mapping'dir: record['comment'], record.get('user', 'Anonim'), dict(record)
+ve 'rating' in record sözlükteki gibi çalışır. Boş (None) alanlar anahtar olarak görünmez.
+"""
+
+from collections.abc import Mapping
+
+
+class _Record(Mapping):
+    """Alanları FIELDS sırasıyla tutan taban sınıf; alt sınıflar sadece __slots__ tanımlar"""
+
+    __slots__ = ()
+    FIELDS = ()
+
+    def __init__(self, **values):
+        for field in self.FIELDS:
+            object.__setattr__(self, field, values.get(field))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} salt okunurdur; değiştirmek için to_dict() kullanın")
+
+    def __getitem__(self, key):
+        value = getattr(self, key, None) if key in self.FIELDS else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return (field for field in self.FIELDS if getattr(self, field) is not None)
+
+    def __len__(self):
+        return sum(1 for field in self.FIELDS if getattr(self, field) is not None)
+
+    def __reduce__(self):
+        # ProcessPoolExecutor (bkz. pdf_export.py) için
+        return (_rebuild, (type(self), self.to_dict()))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS if getattr(self, field) is not None}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+def _rebuild(cls, values):
+    return cls(**values)
+
+
+class CommentRecord(_Record):
+    __slots__ = ('user', 'comment', 'date', 'rating', 'review_id')
+    FIELDS = __slots__
+
+
+class ReviewRecord(_Record):
+    __slots__ = ('seller', 'product', 'comment', 'name', 'date', 'rating', 'review_id')
+    FIELDS = __slots__
+
+
+# Çok tekrar eden alanlar (yer tutucular, satıcı/ürün adları, puanlar); yorum metni tekildir
+INTERNED_FIELDS = frozenset(('user', 'name', 'date', 'seller', 'product', 'rating'))
+
+
+class StringPool:
+    """Aynı değerli string'lerin tek kopyasını tutar ('Anonim', 'Tarih yok', satıcı adları...)"""
+
+    def __init__(self):
+        self._strings = {}
+
+    def intern(self, value):
+        if not isinstance(value, str):
+            return value
+        return self._strings.setdefault(value, value)
+
+    def clear(self):
+        self._strings = {}
+
+    def __len__(self):
+        return len(self._strings)
+
+
+def compact_record(record, pool=None):
+    """Sözlüğü uygun kayıt tipine çevirir; bilinmeyen alan içeren sözlükler olduğu gibi döner"""
+    if isinstance(record, _Record):
+        return record
+
+    cls = ReviewRecord if 'seller' in record or 'product' in record else CommentRecord
+    if not set(record).issubset(cls.FIELDS):
+        return record
+
+    if pool is not None:
+        record = {field: pool.intern(value) if field in INTERNED_FIELDS else value for field, value in record.items()}
+    return cls(**record)
+
+
+def to_plain(record):
+    """JSON'a yazılabilir düz sözlük"""
+    return record.to_dict() if isinstance(record, _Record) else dict(record)
+
+
+def json_default(value):
+    """json.dumps(..., default=json_default): kayıtları kopya listesi oluşturmadan yazar"""
+    if isinstance(value, _Record):
+        return value.to_dict()
+    raise TypeError(f"{type(value).__name__} JSON'a yazılamaz")
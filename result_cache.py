@@ -0,0 +1,195 @@
+"""
+scrape_product sonuçları için SQLite tabanlı, süreli (TTL) ve boyut sınırlı disk önbelleği
+"""
+
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from records import json_default
+
+
+def normalize_url(url):
+    """Aynı ürünü gösteren URL'leri tek anahtara indirger (şema/host küçük harf, izleme parametreleri ve # atılır)"""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_')
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+
+class _SqliteStore:
+    """Ürün (URL, mod) anahtarlı SQLite depolarının ortak tabanı; alt sınıflar SCHEMA'daki tabloları tanımlar"""
+
+    SCHEMA = ()
+
+    def __init__(self, path):
+        self.path = path
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(url, scrape_mode):
+        return f"{normalize_url(url)}|{scrape_mode}"
+
+
+class ResultCache(_SqliteStore):
+    """Sonuçları (URL, mod, max_comments) anahtarıyla saklar; süresi dolanlar okunmaz,
+    toplam boyut max_bytes'ı aşınca en uzun süredir kullanılmayanlar silinir."""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS results (
+            cache_key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            scrape_mode TEXT NOT NULL,
+            max_comments INTEGER,
+            payload TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_results_accessed ON results (accessed_at)",
+    )
+
+    def __init__(self, path='trendyol_cache.sqlite', ttl=24 * 3600, max_bytes=200 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        super().__init__(path)
+
+    @staticmethod
+    def make_key(url, scrape_mode, max_comments):
+        return f"{_SqliteStore.make_key(url, scrape_mode)}|{max_comments or 0}"
+
+    def get(self, url, scrape_mode, max_comments):
+        """Geçerli kayıt varsa {'product_info', 'records'} döner, yoksa None"""
+        key = self.make_key(url, scrape_mode, max_comments)
+        now = time.time()
+
+        with self._connect() as conn:
+            row = conn.execute("SELECT payload, created_at FROM results WHERE cache_key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            if self.ttl is not None and now - row[1] > self.ttl:
+                conn.execute("DELETE FROM results WHERE cache_key = ?", (key,))
+                return None
+
+            conn.execute("UPDATE results SET accessed_at = ? WHERE cache_key = ?", (now, key))
+
+        return json.loads(row[0])
+
+    def put(self, url, scrape_mode, max_comments, product_info, records):
+        key = self.make_key(url, scrape_mode, max_comments)
+        payload = json.dumps({'product_info': product_info, 'records': records}, ensure_ascii=False, default=json_default)
+        now = time.time()
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, normalize_url(url), scrape_mode, max_comments, payload, len(payload), now, now)
+            )
+            self._evict(conn)
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in conn.execute("SELECT cache_key, size FROM results ORDER BY accessed_at").fetchall():
+            conn.execute("DELETE FROM results WHERE cache_key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def invalidate(self, url, scrape_mode, max_comments):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results WHERE cache_key = ?", (self.make_key(url, scrape_mode, max_comments),))
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+
+
+class WatermarkStore(_SqliteStore):
+    """Artımlı çekim için ürün başına son görülen kayıt özetlerini (watermark) saklar"""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS watermarks (
+            product_key TEXT PRIMARY KEY,
+            tokens TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        """,
+    )
+
+    def __init__(self, path='trendyol_watermarks.sqlite'):
+        super().__init__(path)
+
+    def get(self, url, scrape_mode):
+        """Önceki çalıştırmanın en yeni kayıt özetlerini (yeniden eskiye) döner"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT tokens FROM watermarks WHERE product_key = ?", (self.make_key(url, scrape_mode),)
+            ).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def put(self, url, scrape_mode, tokens):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)",
+                (self.make_key(url, scrape_mode), json.dumps(tokens), time.time())
+            )
+
+
+class CheckpointStore(_SqliteStore):
+    """Uzun çekimlerde ürün başına ara durumu (kayıtlar, tekrar indeksi, scroll ilerlemesi) saklar"""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            product_key TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        """,
+    )
+
+    def __init__(self, path='trendyol_checkpoints.sqlite'):
+        super().__init__(path)
+
+    def load(self, url, scrape_mode):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT state FROM checkpoints WHERE product_key = ?", (self.make_key(url, scrape_mode),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, url, scrape_mode, state):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                (self.make_key(url, scrape_mode), json.dumps(state, ensure_ascii=False, default=json_default), time.time())
+            )
+
+    def discard(self, url, scrape_mode):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM checkpoints WHERE product_key = ?", (self.make_key(url, scrape_mode),))
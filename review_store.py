@@ -0,0 +1,141 @@
+"""
+Yorum ve değerlendirmeler için hash indeksli, sıralı sonuç deposu
+"""
+
+import hashlib
+
+from records import StringPool, compact_record, to_plain
+
+
+class ReviewStore:
+    """Kayıtları ekleme sırasıyla tutar; tekrar kontrolü normalize edilmiş anahtarlarla O(1) yapılır"""
+
+    # 'text': sadece metin, 'text_user_date': metin + kullanıcı + tarih, 'hash': tüm alanların içerik özeti
+    KEY_MODES = ('text', 'text_user_date', 'hash')
+
+    def __init__(self, key='text', sinks=None, keep_records=True, compact=True):
+        if key not in self.KEY_MODES:
+            raise ValueError(f"Geçersiz anahtar modu: {key} (seçenekler: {', '.join(self.KEY_MODES)})")
+
+        self.key = key
+        # Kabul edilen her kayıt bu çıktılara (bkz. sinks.py) anında iletilir
+        self.sinks = list(sinks) if sinks else []
+        # False ise kayıtlar bellekte tutulmaz, indekste sadece kısa özetler saklanır
+        self.keep_records = keep_records
+        # True ise kayıtlar __slots__'lu tiplerde ve tekrar eden string'ler tek kopya tutulur (bkz. records.py)
+        self.compact = compact
+        self._pool = StringPool()
+        self.records = []
+        self.count = 0
+        self._index = {}
+        self.duplicate_hits = 0
+
+    @staticmethod
+    def _normalize(value):
+        return ' '.join(str(value).split()).casefold() if value else ''
+
+    def make_key(self, record):
+        text = self._normalize(record.get('comment'))
+
+        if self.key == 'text':
+            return text
+
+        if self.key == 'text_user_date':
+            user = record.get('user', record.get('name'))
+            return (text, self._normalize(user), self._normalize(record.get('date')))
+
+        content = '\x1f'.join(f"{field}={self._normalize(record[field])}" for field in sorted(record))
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+    def _index_key(self, record):
+        key = self.make_key(record)
+        if self.keep_records or isinstance(key, bytes):
+            return key
+        return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).digest()
+
+    def add(self, record):
+        """Kaydı ekler; aynı anahtara sahip kayıt zaten varsa False döner"""
+        key = self._index_key(record)
+        if key in self._index:
+            self.duplicate_hits += 1
+            return False
+
+        self._index[key] = self.count
+        self.count += 1
+        if self.keep_records:
+            self.records.append(compact_record(record, self._pool) if self.compact else record)
+
+        for sink in self.sinks:
+            sink.write(record)
+        return True
+
+    def position(self, record):
+        """Kaydın (veya eşdeğerinin) ekleme sırasını döner, yoksa None"""
+        return self._index.get(self._index_key(record))
+
+    def flush_sinks(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def clear(self):
+        self.records = []
+        self.count = 0
+        self._index = {}
+        self.duplicate_hits = 0
+        self._pool.clear()
+
+    def snapshot(self):
+        """Kayıtları ve tekrar indeksini checkpoint için döner (bkz. records.json_default)"""
+        state = {'key': self.key, 'count': self.count, 'duplicate_hits': self.duplicate_hits}
+        if self.keep_records:
+            # Kayıtlar kopyalanmaz; json.dumps(..., default=records.json_default) ile yazılır
+            state['records'] = list(self.records)
+        else:
+            state['index'] = [key.hex() for key in self._index]
+        return state
+
+    def restore(self, state):
+        """snapshot() çıktısını geri yükler; kayıtlar sink'lere tekrar yazılmaz"""
+        if state['key'] != self.key:
+            raise ValueError(f"Checkpoint anahtar modu farklı: {state['key']} != {self.key}")
+
+        self.clear()
+        if 'records' in state:
+            for record in state['records']:
+                self._index.setdefault(self._index_key(record), len(self._index))
+                if self.keep_records:
+                    self.records.append(compact_record(record, self._pool) if self.compact else record)
+        elif self.keep_records and self.key != 'hash':
+            raise ValueError("Kayıt içermeyen checkpoint, kayıtları bellekte tutan depoya yüklenemez")
+        else:
+            self._index = {bytes.fromhex(key): position for position, key in enumerate(state['index'])}
+        self.count = state['count']
+        self.duplicate_hits = state['duplicate_hits']
+
+    def copy(self):
+        return list(self.records)
+
+    def as_dicts(self):
+        """Kayıtların düz sözlük kopyaları (JSON, önbellek ve checkpoint için)"""
+        return [to_plain(record) for record in self.records]
+
+    def stats(self):
+        return {
+            'key': self.key,
+            'stored': self.count,
+            'in_memory': len(self.records),
+            'interned_strings': len(self._pool),
+            'duplicate_hits': self.duplicate_hits,
+        }
+
+    def __contains__(self, record):
+        return self._index_key(record) in self._index
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
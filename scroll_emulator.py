@@ -0,0 +1,251 @@
+"""
+Sonsuz scroll davranışını taklit eden yerel HTTP sunucusu: ürün sayfası ilk partiyle açılır,
+sayfa sonuna gelindikçe /api/reviews'tan yeni partiler eklenir. Parti boyutu, gecikme,
+sapma (jitter), hata oranı ve toplam sayı ayarlanabilir; değerlendirme modunda
+.review-list-scroll-container içinde scroll edilir.
+
+Kullanım:
+    python scroll_emulator.py --total 20000 --batch-size 20 --latency 0.3 --jitter 0.2 --error-rate 0.05
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from fixtures import synthetic_review, synthetic_reviews, render_comment, render_review, render_page
+
+# Sayfa sonuna yaklaşınca sıradaki partiyi ister; hata olursa kısa bir süre sonra tekrar dener
+_SCROLL_SCRIPT = """
+<div class="loading-spinner" style="display:none">Yükleniyor...</div>
+<script>
+(function () {
+    var cfg = %(config)s;
+    var list = document.querySelector(cfg.listSelector);
+    var container = cfg.container ? document.querySelector('.review-list-scroll-container') : null;
+    var spinner = document.querySelector('.loading-spinner');
+    // Gösterge gerçek sayfadaki gibi listenin hemen altında dursun
+    (container || list.parentNode).appendChild(spinner);
+    var offset = cfg.offset;
+    var loading = false;
+
+    function nearBottom() {
+        if (container) return container.scrollTop + container.clientHeight >= container.scrollHeight - 200;
+        return window.innerHeight + window.scrollY >= document.body.scrollHeight - 200;
+    }
+
+    function load() {
+        if (loading || offset >= cfg.total) return;
+        loading = true;
+        spinner.style.display = 'block';
+        fetch('/api/reviews?mode=' + cfg.mode + '&offset=' + offset + '&limit=' + cfg.batchSize)
+            .then(function (response) {
+                if (!response.ok) throw new Error(response.status);
+                return response.json();
+            })
+            .then(function (data) {
+                list.insertAdjacentHTML('beforeend', data.html);
+                offset = data.next;
+                loading = false;
+                spinner.style.display = 'none';
+                if (nearBottom()) load();
+            })
+            .catch(function () {
+                loading = false;
+                spinner.style.display = 'none';
+                setTimeout(function () { if (nearBottom()) load(); }, cfg.retryMs);
+            });
+    }
+
+    (container || window).addEventListener('scroll', function () { if (nearBottom()) load(); }, {passive: true});
+})();
+</script>
+"""
+
+
+class ScrollEmulator:
+    """Yerel sonsuz scroll sunucusu; start() ile arka planda çalışır, url ürün sayfasını verir"""
+
+    RETRY_MS = 500
+
+    def __init__(self, total=1000, batch_size=20, latency=0.2, jitter=0.1, error_rate=0.0,
+                 mode='comments', scroll_container=True, embed_json_ld=False, seed=42,
+                 host='127.0.0.1', port=0):
+        if mode not in ('comments', 'reviews'):
+            raise ValueError(f"Geçersiz mod: {mode} (seçenekler: comments, reviews)")
+
+        self.total = total
+        self.batch_size = batch_size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.mode = mode
+        self.scroll_container = scroll_container
+        self.embed_json_ld = embed_json_ld
+        self.seed = seed
+        self.host = host
+        self.port = port
+
+        self.stats = {'pages': 0, 'batches': 0, 'errors': 0, 'served_reviews': 0}
+        self._stats_lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/product"
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def render_product_page(self):
+        first = synthetic_reviews(min(self.batch_size, self.total), seed=self.seed)
+        config = {
+            'mode': self.mode,
+            'total': self.total,
+            'offset': len(first),
+            'batchSize': self.batch_size,
+            'container': self.mode == 'reviews' and self.scroll_container,
+            'listSelector': '.review-list' if self.mode == 'reviews' else '.reviews',
+            'retryMs': self.RETRY_MS,
+        }
+        return render_page(
+            first, mode=self.mode, total=self.total, embed_reviews=self.embed_json_ld,
+            scroll_container=self.scroll_container, extra_body=_SCROLL_SCRIPT % {'config': json.dumps(config)}
+        )
+
+    def render_batch(self, offset, limit):
+        """offset'ten itibaren bir parti: kartların HTML'i ve 'network' motorunun okuyacağı JSON alanları"""
+        reviews = [synthetic_review(idx, self.seed) for idx in range(offset, min(offset + limit, self.total))]
+        render = render_review if self.mode == 'reviews' else render_comment
+        return {
+            'html': ''.join(render(review) for review in reviews),
+            'next': offset + len(reviews),
+            'total': self.total,
+            'reviews': [
+                {
+                    'id': review['id'],
+                    'comment': review['comment'],
+                    'userFullName': review['user'],
+                    'commentDate': review['date'],
+                    'rate': review['rating'],
+                    'sellerName': review['seller'],
+                    'productName': review['product'],
+                }
+                for review in reviews
+            ],
+        }
+
+    def _delay(self):
+        with self._stats_lock:
+            spread = self._rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+            failed = self._rng.random() < self.error_rate
+        time.sleep(max(0.0, self.latency + spread))
+        return failed
+
+    def _make_handler(self):
+        emulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body, content_type):
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+
+                if parts.path in ('/', '/product'):
+                    emulator._count('pages')
+                    self._send(200, emulator.render_product_page(), 'text/html; charset=utf-8')
+                elif parts.path == '/api/reviews':
+                    if emulator._delay():
+                        emulator._count('errors')
+                        self._send(500, json.dumps({'error': 'emülasyon hatası'}), 'application/json')
+                        return
+
+                    offset = int(query.get('offset', ['0'])[0])
+                    limit = int(query.get('limit', [str(emulator.batch_size)])[0])
+                    batch = emulator.render_batch(offset, limit)
+                    emulator._count('batches')
+                    emulator._count('served_reviews', len(batch['reviews']))
+                    self._send(200, json.dumps(batch, ensure_ascii=False), 'application/json; charset=utf-8')
+                elif parts.path == '/stats':
+                    with emulator._stats_lock:
+                        stats = dict(emulator.stats)
+                    self._send(200, json.dumps(stats), 'application/json')
+                else:
+                    self._send(404, 'Bulunamadı', 'text/plain; charset=utf-8')
+
+        return Handler
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel sonsuz scroll emülatörü")
+    parser.add_argument('--total', type=int, default=1000)
+    parser.add_argument('--batch-size', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.2, help="parti başına gecikme (sn)")
+    parser.add_argument('--jitter', type=float, default=0.1, help="gecikmeye eklenen ± sapma (sn)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="HTTP 500 dönen parti oranı (0-1)")
+    parser.add_argument('--mode', choices=('comments', 'reviews'), default='comments')
+    parser.add_argument('--no-scroll-container', action='store_true',
+                        help="değerlendirme modunda .review-list-scroll-container yerine sayfa scroll'u")
+    parser.add_argument('--embed-json-ld', action='store_true', help="ilk partiyi JSON-LD'ye de koy")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    emulator = ScrollEmulator(
+        total=args.total, batch_size=args.batch_size, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, mode=args.mode, scroll_container=not args.no_scroll_container,
+        embed_json_ld=args.embed_json_ld, seed=args.seed, host=args.host, port=args.port
+    )
+    emulator.start()
+    print(f"Emülatör çalışıyor: {emulator.url} (istatistikler: http://{args.host}:{emulator.port}/stats)")
+    print("Durdurmak için Ctrl+C")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        emulator.stop()
+        print(f"\nDurduruldu. {emulator.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Yorum/değerlendirme kayıtlarını çekildikleri anda diske yazan akış çıktıları (sink)
+"""
+
+import csv
+import io
+import json
+import os
+import threading
+import time
+
+
+class ReviewSink:
+    """Kabul edilen her kaydı alan çıktı arayüzü; ReviewStore her yeni kayıtta write() çağırır"""
+
+    def write(self, record):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class BufferedFileSink(ReviewSink):
+    """Kayıtları bellekte biriktirip belirli aralıklarla dosyaya yazar.
+
+    flush_every: bu kadar kayıt birikince yazılır
+    flush_interval: son yazımdan bu kadar saniye geçince yazılır
+    fsync: 'never' (işletim sistemine bırak), 'flush' (her yazımda), 'always' (her kayıtta)
+    """
+
+    FSYNC_POLICIES = ('never', 'flush', 'always')
+
+    def __init__(self, path, flush_every=100, flush_interval=5.0, fsync='flush', append=True):
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"Geçersiz fsync politikası: {fsync} (seçenekler: {', '.join(self.FSYNC_POLICIES)})")
+
+        self.path = path
+        self.flush_every = 1 if fsync == 'always' else flush_every
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.written = 0
+
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', newline='')
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _encode(self, record):
+        raise NotImplementedError
+
+    def write(self, record):
+        with self._lock:
+            self._buffer.append(self._encode(record))
+            self.written += 1
+
+            if len(self._buffer) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._file.closed:
+            return
+
+        if self._buffer:
+            self._file.write(''.join(self._buffer))
+            self._buffer = []
+
+        self._file.flush()
+        if self.fsync != 'never':
+            os.fsync(self._file.fileno())
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._file.close()
+
+
+class JsonlSink(BufferedFileSink):
+    """Her kaydı bir JSON satırı olarak yazar"""
+
+    def _encode(self, record):
+        return json.dumps(record, ensure_ascii=False) + '\n'
+
+
+class CsvSink(BufferedFileSink):
+    """Kayıtları CSV satırı olarak yazar; sütunlar verilmezse var olan dosyanın başlığından, o da yoksa ilk kayıttan alınır"""
+
+    def __init__(self, path, fieldnames=None, **kwargs):
+        super().__init__(path, **kwargs)
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        # Var olan dosyaya ekleniyorsa sütunlar başlık satırından alınır; ilk kaydın alanları farklı olabilir
+        if self.fieldnames is None and self._file.tell() > 0:
+            with open(path, encoding='utf-8', newline='') as existing:
+                self.fieldnames = next(csv.reader(existing), None)
+        self._row_buffer = io.StringIO()
+        self._writer = None
+
+    def _encode(self, record):
+        if self._writer is None:
+            if self.fieldnames is None:
+                self.fieldnames = list(record.keys())
+            self._writer = csv.DictWriter(self._row_buffer, fieldnames=self.fieldnames, extrasaction='ignore')
+
+            # Dosya yeni oluşturulduysa başlık satırı yazılır
+            if self._file.tell() == 0:
+                self._writer.writeheader()
+
+        self._writer.writerow(record)
+        row = self._row_buffer.getvalue()
+        self._row_buffer.seek(0)
+        self._row_buffer.truncate(0)
+        return row
@@ -0,0 +1,76 @@
+import datetime
+import os
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from arrow_export import append_to_dataset, export_ipc, export_parquet, parse_date, product_key
+from records import CommentRecord
+
+URL = "https://www.trendyol.com/marka/urun-p-123"
+
+
+def _reviews(count):
+    return [
+        {'seller': f"Mağaza {idx % 3}", 'product': "Ürün", 'comment': f"yorum {idx}", 'name': "Anonim",
+         'date': "12.03.2024", 'rating': str(idx % 6)}
+        for idx in range(count)
+    ]
+
+
+def test_parse_date():
+    assert parse_date("12.03.2024") == datetime.date(2024, 3, 12)
+    assert parse_date("2024-03-12T10:00:00") == datetime.date(2024, 3, 12)
+    assert parse_date("31.02.2024") is None
+    assert parse_date("Tarih yok") is None
+    assert parse_date(None) is None
+
+
+def test_product_key():
+    assert product_key({'name': "Ürün"}, URL) == "123"
+    assert product_key({'name': "Ürün"}) == "Ürün"
+    assert product_key({}) == "bilinmiyor"
+
+
+def test_parquet_row_groups_types_and_metadata(tmp_path):
+    path = export_parquet(str(tmp_path / "out.parquet"), {'name': "Ürün"}, _reviews(25), 'reviews', url=URL,
+                          row_group_size=10)
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.schema_arrow.metadata[b'scrape_mode'] == b'reviews'
+
+    table = parquet.read()
+    assert table.num_rows == 25
+    assert pa.types.is_dictionary(table.schema.field('seller').type)
+    assert table.column('user').to_pylist()[0] == "Anonim"
+    assert table.column('rating').to_pylist()[:6] == [0, 1, 2, 3, 4, 5]
+    assert table.column('date_parsed').to_pylist()[0] == datetime.date(2024, 3, 12)
+
+
+def test_comment_records_and_ipc(tmp_path):
+    records = [CommentRecord(user="Ali", comment="a", rating="x"), CommentRecord(comment="b")]
+    path = export_ipc(str(tmp_path / "out.arrow"), {}, records, 'comments', row_group_size=1)
+
+    with pa.OSFile(path, 'rb') as source:
+        table = pa.ipc.open_file(source).read_all()
+    assert table.column('comment').to_pylist() == ["a", "b"]
+    assert table.column('user').to_pylist() == ["Ali", None]
+    assert table.column('rating').to_pylist() == [None, None]
+    assert table.column('seller').null_count == 2
+
+
+def test_append_to_dataset_partitions(tmp_path):
+    import pyarrow.dataset as ds
+
+    root = str(tmp_path / "dataset")
+    first = append_to_dataset(root, {'name': "Ürün"}, _reviews(5), 'reviews', url=URL)
+    append_to_dataset(root, {'name': "Ürün"}, _reviews(3), 'reviews', url=URL)
+
+    assert os.path.dirname(first) == os.path.join(root, "scrape_mode=reviews", "product_key=123")
+    assert not any(name.startswith('.') for name in os.listdir(os.path.dirname(first)))
+
+    table = ds.dataset(root, partitioning='hive').to_table()
+    assert table.num_rows == 8
+    assert set(table.column('scrape_mode').to_pylist()) == {'reviews'}
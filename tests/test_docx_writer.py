@@ -0,0 +1,43 @@
+import zipfile
+
+from docx_writer import DocxStreamWriter
+
+
+def _document_xml(path):
+    with zipfile.ZipFile(path) as archive:
+        assert {'[Content_Types].xml', '_rels/.rels', 'word/styles.xml', 'word/document.xml'} <= set(archive.namelist())
+        return archive.read('word/document.xml').decode('utf-8')
+
+
+def test_writes_escaped_text_and_structure(tmp_path):
+    path = str(tmp_path / "out.docx")
+    with DocxStreamWriter(path) as writer:
+        writer.heading("Başlık & <özet>", 0)
+        writer.paragraph("birinci satır\nikinci satır")
+        writer.paragraph()
+        writer.fields([("Kullanıcı: ", "Ali"), ("Yorum: ", "güzel\x07")])
+        writer.page_break()
+
+    xml = _document_xml(path)
+    assert 'w:val="Title"' in xml
+    assert 'Başlık &amp; &lt;özet&gt;' in xml
+    assert 'birinci satır</w:t><w:br/><w:t xml:space="preserve">ikinci satır' in xml
+    assert '<w:p/>' in xml
+    assert 'w:val="Record"' in xml and 'w:val="Label"' in xml
+    assert '\x07' not in xml
+    assert '<w:br w:type="page"/>' in xml
+    assert xml.endswith('</w:body></w:document>')
+
+
+def test_opens_with_python_docx(tmp_path):
+    docx = __import__('pytest').importorskip('docx')
+    path = str(tmp_path / "out.docx")
+    with DocxStreamWriter(path) as writer:
+        writer.heading("Yorumlar", 1)
+        for idx in range(50):
+            writer.fields([("Yorum: ", f"yorum {idx}")])
+
+    document = docx.Document(path)
+    assert document.paragraphs[0].text == "Yorumlar"
+    assert document.paragraphs[0].style.name == "Heading 1"
+    assert len(document.paragraphs) == 51
@@ -0,0 +1,75 @@
+import pytest
+
+pytest.importorskip('selenium')
+
+from result_cache import WatermarkStore
+from trendyol_scraper import TrendyolScraper
+
+URL = "https://www.trendyol.com/marka/urun-p-123"
+
+
+class FakePageScraper(TrendyolScraper):
+    """Tarayıcı açmadan sayfadaki yorumları (yeniden eskiye) sırayla işleyen scraper"""
+
+    def __init__(self, page, cancel_after=None, **kwargs):
+        super().__init__(headless=True, http_fast_path=False, incremental=True, **kwargs)
+        self.page = page
+        self.cancel_after = cancel_after
+
+    def _scrape_product(self, url, scrape_mode):
+        for idx, text in enumerate(self.page, 1):
+            if self.cancel_after is not None and idx > self.cancel_after:
+                self.cancelled = True
+                break
+            if self.max_comments and len(self.comments) >= self.max_comments:
+                break
+            self._add_comment({'user': 'Anonim', 'comment': text, 'date': 'Tarih yok'}, idx)
+            if self.watermark_reached:
+                break
+        return self._build_result(scrape_mode)
+
+
+def _page(newest, oldest=1):
+    return [f"yorum {n}" for n in range(newest, oldest - 1, -1)]
+
+
+@pytest.fixture
+def watermarks(tmp_path):
+    store = WatermarkStore(str(tmp_path / "wm.sqlite"))
+    FakePageScraper(_page(10), watermarks=store).scrape_product(URL)
+    return store
+
+
+def _comments(result):
+    return [c['comment'] for c in result['comments']]
+
+
+def test_delta_stops_at_watermark(watermarks):
+    result = FakePageScraper(_page(15), watermarks=watermarks).scrape_product(URL)
+    assert _comments(result) == _page(15, 11)
+
+
+def test_cancelled_run_keeps_previous_watermark(watermarks):
+    before = watermarks.get(URL, 'comments')
+    partial = FakePageScraper(_page(20), cancel_after=5, watermarks=watermarks).scrape_product(URL)
+    assert _comments(partial) == _page(20, 16)
+    assert watermarks.get(URL, 'comments') == before
+
+    result = FakePageScraper(_page(20), watermarks=watermarks).scrape_product(URL)
+    assert _comments(result) == _page(20, 11)
+
+
+def test_max_comments_truncation_keeps_previous_watermark(watermarks):
+    before = watermarks.get(URL, 'comments')
+    truncated = FakePageScraper(_page(20), watermarks=watermarks, max_comments=4).scrape_product(URL)
+    assert len(truncated['comments']) == 4
+    assert watermarks.get(URL, 'comments') == before
+
+    result = FakePageScraper(_page(20), watermarks=watermarks).scrape_product(URL)
+    assert _comments(result) == _page(20, 11)
+
+
+def test_max_comments_reaching_watermark_advances_it(watermarks):
+    FakePageScraper(_page(12), watermarks=watermarks, max_comments=3).scrape_product(URL)
+    result = FakePageScraper(_page(14), watermarks=watermarks).scrape_product(URL)
+    assert _comments(result) == _page(14, 13)
@@ -0,0 +1,38 @@
+import os
+import re
+
+import pytest
+
+pytest.importorskip('reportlab')
+
+from fixtures import synthetic_reviews
+from pdf_export import export_pdf, PdfWriter
+
+
+def _comments(count):
+    return [{'user': r['user'], 'comment': r['comment'], 'date': r['date']} for r in synthetic_reviews(count)]
+
+
+def _reviews(count):
+    return [
+        {'seller': r['seller'], 'product': r['product'], 'comment': r['comment'], 'name': r['user'], 'date': r['date']}
+        for r in synthetic_reviews(count)
+    ]
+
+
+def _page_count(path):
+    with open(path, 'rb') as f:
+        return len(re.findall(rb'/Type\s*/Page\b', f.read()))
+
+
+@pytest.mark.parametrize('mode, records', [('comments', _comments(400)), ('reviews', _reviews(400))])
+def test_multi_page_export(tmp_path, mode, records):
+    path = export_pdf(str(tmp_path / f"{mode}.pdf"), {'name': 'Test'}, records, mode)
+    assert os.path.getsize(path) > 0
+    assert _page_count(path) > 20
+
+
+@pytest.mark.skipif(PdfWriter is None, reason="pypdf yüklü değil")
+def test_multi_page_export_parallel(tmp_path):
+    path = export_pdf(str(tmp_path / "parallel.pdf"), {'name': 'Test'}, _comments(600), 'comments', workers=2, chunk_size=200)
+    assert _page_count(path) > 20
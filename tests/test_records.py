@@ -0,0 +1,56 @@
+import json
+import pickle
+
+import pytest
+
+from records import CommentRecord, ReviewRecord, StringPool, compact_record, json_default, to_plain
+
+
+def test_mapping_behaviour_hides_empty_fields():
+    record = CommentRecord(user="Ali", comment="güzel", date=None)
+    assert record['comment'] == "güzel"
+    assert record.get('date', "Tarih yok") == "Tarih yok"
+    assert 'date' not in record
+    assert dict(record) == {'user': "Ali", 'comment': "güzel"}
+    assert len(record) == 2
+    with pytest.raises(KeyError):
+        record['seller']
+
+
+def test_records_are_read_only():
+    record = CommentRecord(comment="a")
+    with pytest.raises(AttributeError):
+        record.comment = "b"
+    with pytest.raises(AttributeError):
+        record.extra = 1
+
+
+def test_compact_record_picks_type_and_interns_strings():
+    pool = StringPool()
+    first = compact_record({'seller': "Mağaza" + "X", 'product': "Ürün", 'comment': "a", 'name': "Anonim"}, pool)
+    second = compact_record({'seller': "Mağaza" + "X", 'product': "Ürün", 'comment': "b", 'name': "Anonim"}, pool)
+    assert isinstance(first, ReviewRecord)
+    assert first['seller'] is second['seller']
+    assert len(pool) == 3
+
+    assert isinstance(compact_record({'user': "Ali", 'comment': "a"}), CommentRecord)
+    unknown = {'comment': "a", 'helpful': 3}
+    assert compact_record(unknown) is unknown
+    assert compact_record(first) is first
+
+
+def test_pickle_roundtrip():
+    record = ReviewRecord(seller="M", product="P", comment="a", rating="5")
+    restored = pickle.loads(pickle.dumps(record))
+    assert type(restored) is ReviewRecord
+    assert restored == record
+
+
+def test_json_helpers():
+    records = [CommentRecord(user="Ali", comment="a"), {'comment': "b"}]
+    assert json.loads(json.dumps({'comments': records}, default=json_default)) == {
+        'comments': [{'user': "Ali", 'comment': "a"}, {'comment': "b"}]
+    }
+    assert to_plain(records[0]) == {'user': "Ali", 'comment': "a"}
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=json_default)
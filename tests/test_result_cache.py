@@ -0,0 +1,77 @@
+import pytest
+
+from result_cache import CheckpointStore, ResultCache, WatermarkStore, normalize_url
+
+URL = "https://www.trendyol.com/marka/urun-p-123"
+
+
+def test_normalize_url_drops_tracking_and_fragment():
+    assert normalize_url("HTTPS://WWW.Trendyol.com/marka/urun-p-123/?utm_source=x&boutiqueId=1#yorumlar") == \
+        "https://www.trendyol.com/marka/urun-p-123?boutiqueId=1"
+
+
+def test_put_get_and_key_parts(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    cache.put(URL + "?utm_medium=mail", 'comments', None, {'name': "Ürün"}, [{'comment': "a"}])
+
+    assert cache.get(URL, 'comments', 0) == {'product_info': {'name': "Ürün"}, 'records': [{'comment': "a"}]}
+    assert cache.get(URL, 'reviews', None) is None
+    assert cache.get(URL, 'comments', 50) is None
+
+    cache.invalidate(URL, 'comments', None)
+    assert cache.get(URL, 'comments', None) is None
+
+
+def test_expired_entry_is_deleted(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), ttl=60)
+    clock = [1000.0]
+    monkeypatch.setattr('result_cache.time.time', lambda: clock[0])
+
+    cache.put(URL, 'comments', None, {}, [])
+    clock[0] += 59
+    assert cache.get(URL, 'comments', None) is not None
+    clock[0] += 2
+    assert cache.get(URL, 'comments', None) is None
+
+    with cache._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 0
+
+
+def test_eviction_removes_least_recently_used(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('result_cache.time.time', lambda: clock[0])
+    records = [{'comment': "x" * 400}]
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), ttl=None, max_bytes=1000)
+
+    for product in ('a', 'b'):
+        clock[0] += 1
+        cache.put(f"{URL}{product}", 'comments', None, {}, records)
+    clock[0] += 1
+    assert cache.get(f"{URL}a", 'comments', None) is not None
+
+    clock[0] += 1
+    cache.put(f"{URL}c", 'comments', None, {}, records)
+
+    assert cache.get(f"{URL}b", 'comments', None) is None
+    assert cache.get(f"{URL}a", 'comments', None) is not None
+    assert cache.get(f"{URL}c", 'comments', None) is not None
+
+
+def test_watermark_and_checkpoint_stores(tmp_path):
+    watermarks = WatermarkStore(str(tmp_path / "wm.sqlite"))
+    assert watermarks.get(URL, 'comments') == []
+    watermarks.put(URL + "/", 'comments', ["t1", "t2"])
+    assert watermarks.get(URL, 'comments') == ["t1", "t2"]
+
+    checkpoints = CheckpointStore(str(tmp_path / "ck.sqlite"))
+    checkpoints.save(URL, 'reviews', {'loaded': 40})
+    assert checkpoints.load(URL, 'reviews') == {'loaded': 40}
+    checkpoints.discard(URL, 'reviews')
+    assert checkpoints.load(URL, 'reviews') is None
+
+
+@pytest.mark.parametrize('store_class', [ResultCache, WatermarkStore, CheckpointStore])
+def test_reopening_existing_database(tmp_path, store_class):
+    path = str(tmp_path / "store.sqlite")
+    store_class(path)
+    store_class(path)
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from records import CommentRecord, json_default
+from review_store import ReviewStore
+from sinks import ReviewSink
+
+
+class ListSink(ReviewSink):
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+
+def _comment(text, user='Anonim', date='Tarih yok'):
+    return {'user': user, 'comment': text, 'date': date}
+
+
+def test_invalid_key_mode():
+    with pytest.raises(ValueError):
+        ReviewStore('tarih')
+
+
+def test_text_key_ignores_whitespace_case_and_user():
+    store = ReviewStore('text')
+    assert store.add(_comment("Çok  güzel ürün", user='Ali'))
+    assert not store.add(_comment("çok güzel ÜRÜN ", user='Ayşe'))
+    assert len(store) == 1
+    assert store.duplicate_hits == 1
+
+
+def test_text_user_date_key_keeps_same_text_from_different_users():
+    store = ReviewStore('text_user_date')
+    assert store.add(_comment("Güzel", user='Ali'))
+    assert store.add(_comment("Güzel", user='Ayşe'))
+    assert not store.add(_comment(" güzel", user='ali'))
+    assert len(store) == 2
+
+
+def test_hash_key_uses_all_fields():
+    store = ReviewStore('hash')
+    assert store.add({'comment': "Güzel", 'rating': '5'})
+    assert store.add({'comment': "Güzel", 'rating': '4'})
+    assert not store.add({'comment': "güzel", 'rating': '5'})
+
+
+def test_records_are_compact_and_positions_follow_insertion():
+    store = ReviewStore()
+    store.add(_comment("birinci"))
+    store.add(_comment("ikinci"))
+    assert isinstance(store[0], CommentRecord)
+    assert store.position(_comment(" IKINCI")) == 1
+    assert _comment("üçüncü") not in store
+    assert store.stats()['interned_strings'] == 2
+
+
+def test_sinks_receive_only_new_records():
+    sink = ListSink()
+    store = ReviewStore(sinks=[sink], keep_records=False)
+    store.add(_comment("a"))
+    store.add(_comment("a"))
+    store.add(_comment("b"))
+    assert [record['comment'] for record in sink.records] == ["a", "b"]
+    assert len(store) == 2 and store.records == []
+
+
+@pytest.mark.parametrize('key, keep_records', [('text', True), ('text_user_date', True), ('hash', False)])
+def test_snapshot_restore_roundtrip_through_json(key, keep_records):
+    store = ReviewStore(key, keep_records=keep_records)
+    for text in ("a", "b", "a", "c"):
+        store.add(_comment(text))
+
+    state = json.loads(json.dumps(store.snapshot(), default=json_default))
+    restored = ReviewStore(key, keep_records=keep_records)
+    restored.restore(state)
+
+    assert len(restored) == 3
+    assert restored.duplicate_hits == 1
+    assert not restored.add(_comment("b"))
+    assert restored.add(_comment("d"))
+    if keep_records:
+        assert restored.as_dicts() == store.as_dicts() + [_comment("d")]
+
+
+def test_restore_rejects_other_key_mode():
+    store = ReviewStore('text')
+    store.add(_comment("a"))
+    with pytest.raises(ValueError):
+        ReviewStore('hash').restore(store.snapshot())
+
+
+def test_restore_without_records_into_record_keeping_store():
+    store = ReviewStore('hash', keep_records=False)
+    store.add(_comment("a"))
+    with pytest.raises(ValueError):
+        ReviewStore('text').restore(dict(store.snapshot(), key='text'))
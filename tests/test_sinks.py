@@ -0,0 +1,60 @@
+import csv
+import json
+
+import pytest
+
+from sinks import CsvSink, JsonlSink
+
+
+def test_invalid_fsync_policy(tmp_path):
+    with pytest.raises(ValueError):
+        JsonlSink(str(tmp_path / "out.jsonl"), fsync='bazen')
+
+
+def test_jsonl_buffers_until_flush_every(tmp_path):
+    path = tmp_path / "out.jsonl"
+    sink = JsonlSink(str(path), flush_every=3, flush_interval=3600, fsync='never')
+    sink.write({'comment': "bir"})
+    sink.write({'comment': "iki"})
+    assert path.read_text(encoding='utf-8') == ''
+
+    sink.write({'comment': "üç"})
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 3
+
+    sink.write({'comment': "dört"})
+    sink.close()
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['comment'] for line in lines] == ["bir", "iki", "üç", "dört"]
+    assert sink.written == 4
+
+
+def test_jsonl_appends_by_default(tmp_path):
+    path = str(tmp_path / "out.jsonl")
+    for text in ("a", "b"):
+        with JsonlSink(path) as sink:
+            sink.write({'comment': text})
+    with open(path, encoding='utf-8') as f:
+        assert len(f.readlines()) == 2
+
+
+def test_csv_header_written_once_across_appends(tmp_path):
+    path = str(tmp_path / "out.csv")
+    with CsvSink(path, fsync='always') as sink:
+        sink.write({'user': "Ali", 'comment': "satır, virgüllü\nve çok satırlı"})
+    with CsvSink(path) as sink:
+        sink.write({'user': "Ayşe", 'comment': "ikinci", 'rating': '5'})
+
+    with open(path, encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [
+        {'user': "Ali", 'comment': "satır, virgüllü\nve çok satırlı"},
+        {'user': "Ayşe", 'comment': "ikinci"},
+    ]
+
+
+def test_csv_explicit_fieldnames(tmp_path):
+    path = str(tmp_path / "out.csv")
+    with CsvSink(path, fieldnames=['comment']) as sink:
+        sink.write({'user': "Ali", 'comment': "a"})
+    with open(path, encoding='utf-8') as f:
+        assert f.read().splitlines() == ['comment', 'a']
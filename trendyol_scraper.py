@@ -1,32 +1,278 @@
+import os
+import re
 import time
 import json
+import base64
+import hashlib
+import threading
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from docx import Document
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.enums import TA_LEFT
-from reportlab.lib.colors import black
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from review_store import ReviewStore
+from browser_pool import BrowserPool
+from docx_writer import DocxStreamWriter
+from pdf_export import export_pdf
+from arrow_export import export_parquet, export_ipc, append_to_dataset
+from result_cache import ResultCache, WatermarkStore, CheckpointStore
+from metrics import ScrapeMetrics, timed_phase
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_etree = None
+    lxml_html = None
+
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """Tüm scraper'lar arasında paylaşılan, bağlantı havuzlu requests oturumu"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=2)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({'User-Agent': USER_AGENT, 'Accept-Language': 'tr-TR,tr;q=0.9'})
+            _http_session = session
+        return _http_session
+
+
+def _parse_json_ld_blocks(html):
+    json_ld_data = []
+    for block in JSON_LD_PATTERN.findall(html):
+        try:
+            json_ld_data.append(json.loads(block))
+        except json.JSONDecodeError:
+            continue
+    return json_ld_data
+
+
+@lru_cache(maxsize=None)
+def _compiled_xpath(selector, relative=False):
+    """Kodda kullanılan basit CSS seçicilerini (".a .b", "span.c") derlenmiş XPath'e çevirir"""
+    steps = []
+    for part in selector.split():
+        tag, *classes = part.split('.')
+        conditions = ''.join(
+            f"[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]" for cls in classes
+        )
+        steps.append(f"{tag or '*'}{conditions}")
+
+    prefix = './/' if relative else '//'
+    return lxml_etree.XPath(prefix + '//'.join(steps))
+
+
+_SKIPPED_TAGS = frozenset(('script', 'style', 'template', 'noscript'))
+_BLOCK_TAGS = frozenset(('div', 'p', 'li', 'ul', 'ol', 'section', 'article', 'header', 'footer', 'tr',
+                         'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'pre'))
+_HIDDEN_STYLE = re.compile(r'display\s*:\s*none|visibility\s*:\s*hidden', re.IGNORECASE)
+
+
+def _inner_text(element):
+    """lxml öğesinin metnini Selenium .text / innerText'e yakın okur: <br> ve blok öğeler satır sonu olur,
+    gizli (hidden, display:none, script/style) alt öğeler atlanır, satır içi boşluklar tek boşluğa iner"""
+    parts = [element.text or '']
+
+    def walk(node):
+        for child in node:
+            tag = child.tag if isinstance(child.tag, str) else None
+            if tag is None or tag in _SKIPPED_TAGS or child.get('hidden') is not None \
+                    or _HIDDEN_STYLE.search(child.get('style') or ''):
+                pass
+            elif tag == 'br':
+                parts.append('\n')
+            else:
+                block = tag in _BLOCK_TAGS
+                if block:
+                    parts.append('\n')
+                parts.append(child.text or '')
+                walk(child)
+                if block:
+                    parts.append('\n')
+            parts.append(child.tail or '')
+
+    walk(element)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
 
 
 class TrendyolScraper:
-    def __init__(self, headless=False, max_comments=None):
+    COMMENT_ITEM_SELECTOR = "div.review"
+    COMMENT_FIELD_SELECTORS = {
+        'user': ".name",
+        'comment': "span.review-comment",
+        'date': ".date",
+    }
+
+    REVIEW_ITEM_SELECTOR = ".review-list .review"
+    REVIEW_FIELD_SELECTORS = {
+        'seller': ".item-header .seller",
+        'product': ".item-header .product",
+        'comment': ".review-info .name-wrapper .comment",
+        'name': ".review-info .review-info-detail .name",
+        'date': ".review-info .review-info-detail .date",
+    }
+
+    SCROLL_MAX = 200
+    SCROLL_EMPTY_LIMIT = 5
+    SCROLL_IDLE_LIMIT = 2
+    SCROLL_INITIAL_TIMEOUT = 3.0
+    SCROLL_MIN_TIMEOUT = 0.5
+    SCROLL_MAX_TIMEOUT = 5.0
+    LOADER_SELECTOR = "[class*='loading'], [class*='spinner'], [class*='loader']"
+    READ_MORE_SELECTOR = "a[class*='read-more'], button[class*='read-more'], [class*='show-more'], [class*='devamini-oku']"
+    EXPAND_SETTLE_MS = 300
+    EXPAND_TIMEOUT_MS = 5000
+    HTTP_TIMEOUT = 15
+    READY_TIMEOUT = 10
+    COMMENTS_TAB_TIMEOUT = 5
+    WATERMARK_SIZE = 20
+    CHECKPOINT_INTERVAL = 30
+    PROGRESS_INTERVAL = 0.25
+
+    # lean profilde CDP Network.setBlockedURLs ile düşürülen fontlar, medya ve üçüncü taraf analiz/reklam alanları
+    LEAN_BLOCKED_URL_PATTERNS = [
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+        "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+        "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+        "*googleadservices.com*", "*facebook.net*", "*facebook.com/tr*", "*connect.facebook*",
+        "*hotjar.com*", "*criteo.com*", "*criteo.net*", "*adform.net*", "*analytics.tiktok.com*",
+        "*clarity.ms*", "*useinsider.com*", "*nr-data.net*", "*newrelic.com*", "*mc.yandex*",
+        "*bat.bing.com*", "*ct.pinterest.com*", "*snap.licdn.com*",
+    ]
+
+    BULK_ENGINES = ('snapshot', 'script', 'network')
+
+    # Eski sıralı denemelerin tek sorguda birleşimi; görünür ilk eşleşme tıklanır, '#comments' bağlantısı öncelikli
+    COMMENTS_TAB_XPATH = (
+        "//a[contains(@href, '#comments')]"
+        " | //div[contains(text(), 'Değerlendirmeler')]"
+        " | //button[contains(text(), 'Değerlendirmeler')]"
+        " | //a[contains(text(), 'Yorumlar')]"
+    )
+
+    # Sayfa, ürün JSON-LD'si veya yorum kapsayıcısı DOM'a eklenince hazır sayılır
+    READY_SCRIPT = """
+        if (document.readyState === 'loading') return false;
+        const hasProduct = Array.from(document.querySelectorAll('script[type="application/ld+json"]'))
+            .some(script => script.textContent.includes('Product'));
+        return hasProduct || !!document.querySelector(arguments[0]);
+    """
+
+    # 'network' modunda yakalanacak yanıtların URL deseni ve JSON alan adı adayları
+    REVIEW_API_PATTERN = re.compile(r'review|comment', re.IGNORECASE)
+    NETWORK_FIELD_KEYS = {
+        'comment': ('comment', 'commentText', 'reviewBody'),
+        'user': ('userFullName', 'userName', 'nickName', 'author'),
+        'date': ('commentDateISOtype', 'commentDate', 'createdDate', 'lastModifiedDate', 'datePublished'),
+        'rating': ('rate', 'rating', 'star'),
+        'review_id': ('id', 'reviewId', 'commentId'),
+        'seller': ('sellerName', 'seller', 'merchantName'),
+        'product': ('productName', 'productTitle', 'product'),
+    }
+
+    def __init__(self, headless=False, max_comments=None, extraction_engine='snapshot', dedup_key='text', pool=None,
+                 http_fast_path=True, sinks=None, keep_in_memory=True, cache=None,
+                 incremental=False, watermarks=None, lean=False, lean_unblock=None, prune_dom=False,
+                 checkpoint=False, resume=False, checkpoints=None, progress_callback=None):
         self.driver = None
+        # Verilirse Chrome oturumları her çağrıda açılıp kapatılmak yerine BrowserPool'dan ödünç alınır
+        self.pool = pool
+        # Yorum modunda önce tarayıcısız HTTP + JSON-LD denenir; yorum yoksa Selenium'a geçilir
+        self.http_fast_path = http_fast_path
+        # Verilirse sonuçlar ResultCache (SQLite) üzerinden URL/mod/max_comments anahtarıyla saklanır
+        self.cache = cache
+        # Artımlı mod: önceki çalıştırmanın en yeni kayıtlarına ulaşınca scroll ve çekim durur, sadece yeniler döner
+        self.incremental = incremental
+        self.watermarks = watermarks if watermarks is not None else (WatermarkStore() if incremental else None)
+        self._watermark = set()
+        self._new_watermark = []
+        self._watermark_checked = 0
+        self.watermark_reached = False
+        # lean: görseller, fontlar, medya ve izleyiciler engellenir. lean_unblock'taki ifadeleri içeren desenler
+        # tümüyle kaldırılır (ör. "*.svg" tüm SVG'lere izin verir); belirli bir alan adına izin verip aynı dosya
+        # türünü başka yerde engellemek Network.setBlockedURLs ile mümkün değildir
+        self.lean = lean
+        self.lean_unblock = list(lean_unblock or [])
+        self._performance_logging = lean or extraction_engine == 'network'
+        self._review_request_ids = []
+        self._review_payloads = []
+        self.blocked_requests = 0
+        self.page_weight = {}
         self.headless = headless
         self.max_comments = max_comments
-        self.comments = []
-        self.reviews = []
+        # 'snapshot': page_source tek seferde lxml ile ayrıştırılır
+        # 'script': tek execute_script çağrısı tüm alanları JSON olarak döner
+        # 'network': scroll'un tetiklediği review JSON yanıtları Chrome performance log'dan okunur
+        # 'elements': element bazlı Selenium döngüsü
+        self.extraction_engine = extraction_engine
+        self.skipped_nodes = 0
+        self.expanded_count = None
+        # prune_dom (snapshot/script): scroll sırasında yeni düğümler okunup içleri boşaltılır, tarayıcı belleği sabit kalır
+        self.prune_dom = prune_dom
+        self._pruned_rows = []
+        # checkpoint: toplanan kayıtlar ve tekrar indeksi CHECKPOINT_INTERVAL saniyede bir ve hata anında diske yazılır
+        # resume: varsa önceki checkpoint yüklenir, görülmüş kayıtlar atlanarak devam edilir (checkpoint'i de açar)
+        self.resume = resume
+        self.checkpoints = checkpoints if checkpoints is not None else (CheckpointStore() if checkpoint or resume else None)
+        self._checkpoint_target = None
+        self._last_checkpoint = 0.0
+        self._loaded_count = 0
+        self._processed_rows = 0
+        self._resume_processed = 0
+        self._resume_skip_rows = 0
+        self.scroll_interrupted = False
+        # progress_callback: scroll/çekim ilerlemesi sözlük olarak bu fonksiyona iletilir (bkz. _emit_progress)
+        # cancel() başka bir thread'den scroll'u durdurur; o ana kadar toplananlar korunur
+        self.progress_callback = progress_callback
+        self.cancel_event = threading.Event()
+        self.cancelled = False
+        self._progress_started = time.monotonic()
+        self._last_progress = 0.0
+        # Tekrar kontrolü anahtarı: 'text', 'text_user_date' veya 'hash' (bkz. ReviewStore)
+        # sinks: kabul edilen her kayıt anında bu çıktılara yazılır (bkz. sinks.py)
+        # keep_in_memory=False ile kayıtlar bellekte tutulmaz, sadece sink'lere akar
+        self.keep_in_memory = keep_in_memory
+        self.comments = ReviewStore(dedup_key, sinks=sinks, keep_records=keep_in_memory)
+        self.reviews = ReviewStore(dedup_key, sinks=sinks, keep_records=keep_in_memory)
         self.product_info = {}
+        self.rating_count = None
+        self.review_count = None
+        self.scroll_latencies = []
+        # Son scrape_product çağrısının aşama süreleri ve sayaçları (bkz. metrics.py)
+        self.metrics = ScrapeMetrics()
 
     def setup_driver(self):
+        self.driver = self.create_driver()
+
+    def create_driver(self):
+        """Yapılandırılmış yeni bir Chrome oturumu açar (BrowserPool da bunu kullanır)"""
         chrome_options = Options()
 
         if self.headless:
@@ -37,47 +283,407 @@ class TrendyolScraper:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        chrome_options.add_argument(f"user-agent={USER_AGENT}")
+        # DOMContentLoaded'da döner; gerisi _wait_until_ready'deki somut sinyallerle beklenir
+        chrome_options.page_load_strategy = 'eager'
+
+        if self.lean:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.default_content_setting_values.notifications': 2,
+                'profile.managed_default_content_settings.media_stream': 2,
+            })
+
+        if self._performance_logging:
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.maximize_window()
+
+        # Uzun scroll'larda Resource Timing tamponu (varsayılan 250) dolmasın
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': 'performance.setResourceTimingBufferSize(100000);'
+        })
+
+        if self.lean:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.lean_blocked_patterns()})
+        # Havuzdan alınan oturumun hangi ayarlarla açıldığı _prepare_pooled_driver'da kontrol edilir
+        driver.trendyol_profile = {'lean': self.lean}
+        return driver
+
+    def _prepare_pooled_driver(self):
+        """Havuzdan gelen oturumu bu scraper'ın ayarlarına uydurur, uyamıyorsa uyarır veya hata verir.
+
+        URL engellemesi CDP ile her işte yeniden kurulur (lean değilse önceki işten kalan liste temizlenir).
+        Görsel/medya kapatan Chrome tercihleri sadece açılışta verilebildiğinden lean=False açılmış
+        oturumda uyarı basılır; görseller yine de URL engellemesiyle indirilmez.
+        """
+        profile = getattr(self.driver, 'trendyol_profile', {})
+        if self.lean and not profile.get('lean'):
+            print("Uyarı: havuzdaki oturum lean=False ile açılmış; görsel/medya tercihleri uygulanamıyor, sadece URL "
+                  "engellemesi kullanılacak. Tam lean profil için havuzu "
+                  "BrowserPool(driver_factory=TrendyolScraper(lean=True).create_driver) ile oluşturun")
+
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.lean_blocked_patterns() if self.lean else []})
+        except Exception as e:
+            print(f"Havuzdaki oturumda URL engellemesi ayarlanamadı: {str(e)}")
+
+        if not self._performance_logging:
+            return
+        # goog:loggingPrefs da sadece açılışta verilebilir; log kapalıysa get_log hata verir
+        try:
+            self.driver.get_log('performance')
+        except Exception:
+            if self.extraction_engine == 'network':
+                raise ValueError("'network' motoru performance log'u açık bir oturum ister; havuzu "
+                                 "BrowserPool(driver_factory=TrendyolScraper(extraction_engine='network').create_driver) "
+                                 "ile oluşturun")
+            print("Uyarı: havuzdaki oturumda performance log kapalı, engellenen istekler sayılamayacak")
+
+    def lean_blocked_patterns(self):
+        """Engellenecek URL desenleri; lean_unblock'taki bir ifadeyi içeren desenler listeden çıkarılır"""
+        return [
+            pattern for pattern in self.LEAN_BLOCKED_URL_PATTERNS
+            if not any(unblocked in pattern for unblocked in self.lean_unblock)
+        ]
+
+    def _reset_results(self):
+        self.comments.clear()
+        self.reviews.clear()
+        self.product_info = {}
+        self.rating_count = None
+        self.review_count = None
+        self.scroll_latencies = []
+        self.skipped_nodes = 0
+        self.expanded_count = None
+        self._pruned_rows = []
+        self._checkpoint_target = None
+        self._loaded_count = 0
+        self._processed_rows = 0
+        self._resume_processed = 0
+        self._resume_skip_rows = 0
+        self.scroll_interrupted = False
+        self.cancelled = False
+        self._progress_started = time.monotonic()
+        self._last_progress = 0.0
+        self._new_watermark = []
+        self._watermark_checked = 0
+        self.watermark_reached = False
+        self._review_request_ids = []
+        self._review_payloads = []
+        self.blocked_requests = 0
+        self.page_weight = {}
+
+    def scrape_product(self, url, scrape_mode='comments', force_refresh=False):
+        """Ürünü çeker; cache verilmişse ve force_refresh=False ise geçerli önbellek kaydı döndürülür"""
+        self.metrics = ScrapeMetrics(url, scrape_mode)
+        self.cancel_event.clear()
+        self._reset_results()
+
+        try:
+            if self.incremental:
+                previous_tokens = self.watermarks.get(url, scrape_mode)
+                self._watermark = set(previous_tokens)
+                if previous_tokens:
+                    print(f"Artımlı mod: önceki çalıştırmadan {len(previous_tokens)} kayıtlık watermark yüklendi")
+
+                result = self._scrape_product(url, scrape_mode)
+                store = self.reviews if scrape_mode == 'reviews' else self.comments
+
+                incomplete = self._incomplete_delta_reason(store, previous_tokens)
+                if incomplete:
+                    # Watermark ilerletilirse atlanan yeni kayıtlar bir daha hiç çekilmez; önceki watermark korunur
+                    print(f"Artımlı mod: {incomplete}, watermark güncellenmedi (sonraki çalıştırma aynı noktadan başlar)")
+                else:
+                    tokens = self._new_watermark + [t for t in previous_tokens if t not in self._new_watermark]
+                    self.watermarks.put(url, scrape_mode, tokens[:self.WATERMARK_SIZE])
+                print(f"Artımlı mod: {len(store)} yeni kayıt")
+                return result
+
+            if self.cache and not force_refresh and self._load_from_cache(url, scrape_mode):
+                self.metrics.incr('cache_hits')
+                return self._build_result(scrape_mode)
+
+            result = self._scrape_product(url, scrape_mode)
+
+            # İptal edilen veya scroll'u yarıda kalan çekim eksiktir; önbelleğe yazılırsa sonraki çalıştırmalar kesik veri döner
+            if self.cancelled or self.scroll_interrupted:
+                print("Çekim tamamlanmadı, sonuç önbelleğe yazılmadı")
+            elif self.cache and self.keep_in_memory:
+                records = (self.reviews if scrape_mode == 'reviews' else self.comments).records
+                try:
+                    self.cache.put(url, scrape_mode, self.max_comments, self.product_info, records)
+                except Exception as e:
+                    print(f"Önbelleğe yazılamadı: {str(e)}")
 
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.maximize_window()
+            return result
+        finally:
+            self.metrics.stop()
+            self._emit_progress('done', force=True)
+            print(self.metrics.summary())
+
+    def _incomplete_delta_reason(self, store, previous_tokens):
+        """Artımlı çekim önceki watermark'a kadar tüm yeni kayıtları almadıysa nedenini döner, aldıysa None.
+
+        İptal ve yarıda kalan scroll her zaman eksiktir. max_comments sınırı ise sadece önceki bir watermark
+        varken ve ona ulaşılmadan dolduysa eksik sayılır; ilk çalıştırma başlangıç noktasını belirler.
+        """
+        if self.cancelled:
+            return "çekim iptal edildi"
+        if self.scroll_interrupted:
+            return "scroll yarıda kaldı"
+        if previous_tokens and not self.watermark_reached and self.max_comments and len(store) >= self.max_comments:
+            return f"max_comments ({self.max_comments}) önceki watermark'a ulaşmadan doldu"
+        return None
+
+    def _load_from_cache(self, url, scrape_mode):
+        try:
+            cached = self.cache.get(url, scrape_mode, self.max_comments)
+        except Exception as e:
+            print(f"Önbellek okunamadı: {str(e)}")
+            return False
+
+        if cached is None:
+            return False
+
+        self.product_info = cached['product_info']
+        store = self.reviews if scrape_mode == 'reviews' else self.comments
+        for record in cached['records']:
+            store.add(record)
+        store.flush_sinks()
+
+        print(f"✓ Önbellekten yüklendi: {len(store)} kayıt ({url})")
+        return True
+
+    def _scrape_product(self, url, scrape_mode):
+        if scrape_mode != 'reviews' and self.http_fast_path and not self.max_comments:
+            with self.metrics.phase('http_fast_path'):
+                fast_path_ok = self._scrape_via_http(url)
+            if fast_path_ok:
+                self.comments.flush_sinks()
+                if self.checkpoints:
+                    self.checkpoints.discard(url, scrape_mode)
+                return self._build_result(scrape_mode)
+            self._reset_results()
+
+        if self.checkpoints:
+            self._checkpoint_target = (url, scrape_mode)
+            self._last_checkpoint = time.monotonic()
+            if self.resume:
+                self._restore_checkpoint(url, scrape_mode)
 
-    def scrape_product(self, url, scrape_mode='comments'):
         try:
-            self.setup_driver()
+            with self.metrics.phase('driver_startup'):
+                if self.pool:
+                    self.driver = self.pool.acquire()
+                    self._prepare_pooled_driver()
+                else:
+                    self.setup_driver()
             print(f"URL açılıyor: {url}")
             print(f"Scraping modu: {scrape_mode}")
-            self.driver.get(url)
-
-            time.sleep(3)
+            with self.metrics.phase('navigation'):
+                self.driver.get(url)
+                self._wait_until_ready()
 
             self._extract_product_info()
 
-            self._navigate_to_comments()
+            with self.metrics.phase('navigation'):
+                self._navigate_to_comments()
 
             if scrape_mode == 'reviews':
                 self._extract_reviews_from_html()
-                return {
-                    'product_info': self.product_info,
-                    'reviews': self.reviews,
-                    'total_reviews': len(self.reviews),
-                    'scrape_mode': 'reviews'
-                }
             else:
                 self._extract_comments()
-                return {
-                    'product_info': self.product_info,
-                    'comments': self.comments,
-                    'total_comments': len(self.comments),
-                    'scrape_mode': 'comments'
-                }
+
+            self._measure_page_weight()
+
+            # Scroll yarıda kesildiyse checkpoint sonraki resume için güncellenip saklanır
+            if self.scroll_interrupted:
+                self._save_checkpoint(force=True)
+            elif self.checkpoints:
+                self.checkpoints.discard(url, scrape_mode)
+
+            return self._build_result(scrape_mode)
 
         except Exception as e:
             print(f"Hata oluştu: {str(e)}")
+            self.metrics.incr('errors')
+            self._save_checkpoint(force=True)
             raise
         finally:
+            self.comments.flush_sinks()
+            self.reviews.flush_sinks()
+
             if self.driver:
-                self.driver.quit()
+                if self.pool:
+                    self.pool.release(self.driver)
+                    self.driver = None
+                else:
+                    self.driver.quit()
+
+    def cancel(self):
+        """Devam eden çekimi durdurur (thread-safe); scroll biter, yüklenenler işlenip döndürülür"""
+        self.cancel_event.set()
+
+    def _check_cancelled(self):
+        if self.cancel_event.is_set() and not self.cancelled:
+            self.cancelled = True
+            print("\n⛔ İptal istendi, scroll durduruluyor. Toplananlar korunacak")
+        return self.cancelled
+
+    def _expected_comment_total(self):
+        """Sayfadaki yorum sayısı: JSON-LD reviewCount, yoksa ratingCount (yorumsuz puanları da sayar)"""
+        return self.review_count or self.rating_count
+
+    def _progress_target(self):
+        """Beklenen toplam: max_comments ve JSON-LD yorum sayısının küçüğü (bilinmiyorsa None).
+
+        Mağaza değerlendirmelerinde None döner; JSON-LD sayıları ürün yorumlarına aittir ve ilerleme çubuğunu yanıltır.
+        """
+        if self.metrics.scrape_mode == 'reviews':
+            return None
+        targets = [value for value in (self.max_comments, self._expected_comment_total()) if value]
+        return min(targets) if targets else None
+
+    def _emit_progress(self, phase, loaded=None, scrolls=None, force=False):
+        """progress_callback'e en fazla PROGRESS_INTERVAL saniyede bir ilerleme olayı gönderir"""
+        if not self.progress_callback:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_progress < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+
+        elapsed = now - self._progress_started
+        extracted = len(self.reviews) + len(self.comments)
+        counted = loaded if phase == 'scroll' and loaded is not None else extracted
+        event = {
+            'phase': phase,
+            'scrolls': scrolls,
+            'loaded': loaded if loaded is not None else self._loaded_count,
+            'extracted': extracted,
+            'target': self._progress_target(),
+            'elapsed': elapsed,
+            'rate': counted / elapsed if elapsed > 0 else 0.0,
+            'cancelled': self.cancelled,
+        }
+
+        try:
+            self.progress_callback(event)
+        except Exception as e:
+            print(f"İlerleme bildirimi başarısız: {str(e)}")
+
+    def _checkpoint_store(self):
+        return self.reviews if self._checkpoint_target[1] == 'reviews' else self.comments
+
+    def _save_checkpoint(self, force=False):
+        """En fazla CHECKPOINT_INTERVAL saniyede bir (force ile hemen) ara durumu diske yazar"""
+        if self._checkpoint_target is None:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < self.CHECKPOINT_INTERVAL:
+            return
+        self._last_checkpoint = now
+
+        store = self._checkpoint_store()
+        # Sink'ler checkpoint ile aynı noktaya kadar diske yazılmış olsun
+        store.flush_sinks()
+        state = {
+            'product_info': self.product_info,
+            'rating_count': self.rating_count,
+            'review_count': self.review_count,
+            'store': store.snapshot(),
+            'pending_rows': self._pruned_rows,
+            'loaded': self._loaded_count,
+            'processed': self._processed_rows,
+        }
+
+        try:
+            self.checkpoints.save(*self._checkpoint_target, state)
+        except Exception as e:
+            print(f"Checkpoint yazılamadı: {str(e)}")
+            return
+
+        if force:
+            print(f"Checkpoint kaydedildi: {len(store)} kayıt, {len(self._pruned_rows)} okunmuş satır, "
+                  f"{self._loaded_count} yüklenmiş öğe")
+
+    def _restore_checkpoint(self, url, scrape_mode):
+        try:
+            state = self.checkpoints.load(url, scrape_mode)
+        except Exception as e:
+            print(f"Checkpoint okunamadı: {str(e)}")
+            return
+
+        if not state:
+            print("Checkpoint bulunamadı, baştan başlanıyor")
+            return
+
+        store = self._checkpoint_store()
+        try:
+            store.restore(state['store'])
+        except ValueError as e:
+            print(f"Checkpoint kullanılamadı: {str(e)}")
+            return
+
+        self.product_info = state['product_info']
+        self.rating_count = state['rating_count']
+        self.review_count = state.get('review_count')
+        self._pruned_rows = state['pending_rows']
+        self._resume_skip_rows = len(self._pruned_rows)
+        self._resume_processed = state['processed']
+        print(f"Checkpoint'ten devam ediliyor: {len(store)} kayıt, {state['loaded']} yüklenmiş öğe")
+
+    def _build_result(self, scrape_mode):
+        # Sonuç depodaki kayıt listesini kopyalamadan taşır; JSON için json.dumps(result, default=json_default).
+        # Bir sonraki çekim depoyu yeni bir listeyle sıfırladığından dönen liste değişmez
+        if scrape_mode == 'reviews':
+            return {
+                'product_info': self.product_info,
+                'reviews': self.reviews.records,
+                'total_reviews': len(self.reviews),
+                'scrape_mode': 'reviews'
+            }
+
+        return {
+            'product_info': self.product_info,
+            'comments': self.comments.records,
+            'total_comments': len(self.comments),
+            'scrape_mode': 'comments'
+        }
+
+    def _scrape_via_http(self, url):
+        """Tarayıcı açmadan ürün HTML'ini indirip JSON-LD'den ürün bilgisi ve yorumları okur"""
+        if requests is None:
+            return False
+
+        print(f"HTTP ile deneniyor (tarayıcısız): {url}")
+        try:
+            response = _get_http_session().get(url, timeout=self.HTTP_TIMEOUT)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"HTTP isteği başarısız, tarayıcı kullanılacak: {str(e)}")
+            return False
+
+        json_ld_data = _parse_json_ld_blocks(response.text)
+
+        if not self._parse_product_json_ld(json_ld_data):
+            print("HTTP yanıtında JSON-LD ürün bilgisi yok, tarayıcı kullanılacak")
+            return False
+
+        if not self._add_comments_from_json_ld(json_ld_data):
+            print("JSON-LD'de yorum dizisi yok, tarayıcı kullanılacak")
+            return False
+
+        print(f"✓ Tarayıcı açılmadan JSON-LD'den {len(self.comments)} yorum çekildi")
+        return True
 
     def _extract_json_ld(self):
         try:
@@ -96,29 +702,10 @@ class TrendyolScraper:
             print(f"JSON-LD çekilirken hata: {str(e)}")
             return []
 
+    @timed_phase('product_info')
     def _extract_product_info(self):
         try:
-            json_ld_data = self._extract_json_ld()
-
-            product_data = None
-            for data in json_ld_data:
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    product_data = data
-                    break
-
-            if product_data:
-                self.product_info['name'] = product_data.get('name', 'Ürün adı bulunamadı')
-
-                rating_data = product_data.get('aggregateRating', {})
-                if isinstance(rating_data, dict):
-                    rating_value = rating_data.get('ratingValue', 'N/A')
-                    rating_count = rating_data.get('ratingCount', 0)
-                    self.product_info['rating'] = f"{rating_value} ({rating_count} değerlendirme)"
-                else:
-                    self.product_info['rating'] = 'Puan bulunamadı'
-
-                print(f"Ürün bilgisi: {self.product_info['name']}")
-            else:
+            if not self._parse_product_json_ld(self._extract_json_ld()):
                 print("JSON-LD'de ürün bulunamadı, CSS selector kullanılıyor...")
                 self._extract_product_info_fallback()
 
@@ -126,6 +713,37 @@ class TrendyolScraper:
             print(f"Ürün bilgisi çekilirken hata: {str(e)}")
             self._extract_product_info_fallback()
 
+    def _parse_product_json_ld(self, json_ld_data):
+        product_data = None
+        for data in json_ld_data:
+            if isinstance(data, dict) and data.get('@type') == 'Product':
+                product_data = data
+                break
+
+        if not product_data:
+            return False
+
+        self.product_info['name'] = product_data.get('name', 'Ürün adı bulunamadı')
+
+        rating_data = product_data.get('aggregateRating', {})
+        if isinstance(rating_data, dict):
+            rating_value = rating_data.get('ratingValue', 'N/A')
+            rating_count = rating_data.get('ratingCount', 0)
+            try:
+                self.rating_count = int(rating_count) or None
+            except (TypeError, ValueError):
+                self.rating_count = None
+            try:
+                self.review_count = int(rating_data.get('reviewCount', 0)) or None
+            except (TypeError, ValueError):
+                self.review_count = None
+            self.product_info['rating'] = f"{rating_value} ({rating_count} değerlendirme)"
+        else:
+            self.product_info['rating'] = 'Puan bulunamadı'
+
+        print(f"Ürün bilgisi: {self.product_info['name']}")
+        return True
+
     def _extract_product_info_fallback(self):
         try:
             try:
@@ -156,39 +774,64 @@ class TrendyolScraper:
         except Exception as e:
             print(f"Ürün bilgisi (fallback) çekilirken hata: {str(e)}")
 
+    def _review_container_selector(self):
+        return f"{self.COMMENT_ITEM_SELECTOR}, {self.REVIEW_ITEM_SELECTOR}"
+
+    def _wait_until_ready(self):
+        """Sabit bekleme yerine ürün JSON-LD'si veya yorum kapsayıcısı gelene kadar bekler"""
+        started = time.perf_counter()
+        try:
+            WebDriverWait(self.driver, self.READY_TIMEOUT, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(self.READY_SCRIPT, self._review_container_selector())
+            )
+            print(f"Sayfa hazır ({time.perf_counter() - started:.1f} sn)")
+        except TimeoutException:
+            print(f"Sayfa {self.READY_TIMEOUT} sn içinde hazır olmadı, devam ediliyor")
+
+    def _visible_comments_tab(self, driver):
+        """WebDriverWait koşulu: eşleşenler arasından görünür ve etkin ilk sekme, '#comments' bağlantısı öncelikli.
+
+        find_element sadece belge sırasındaki ilk eşleşmeyi döndürür; o gizliyse bekleme boşa zaman aşımına düşerdi.
+        """
+        candidates = []
+        for element in driver.find_elements(By.XPATH, self.COMMENTS_TAB_XPATH):
+            try:
+                if element.is_displayed() and element.is_enabled():
+                    candidates.append(element)
+            except StaleElementReferenceException:
+                continue
+
+        for element in candidates:
+            try:
+                if '#comments' in (element.get_attribute('href') or ''):
+                    return element
+            except StaleElementReferenceException:
+                continue
+        return candidates[0] if candidates else False
+
     def _navigate_to_comments(self):
         try:
-            time.sleep(2)
+            # Tembel yüklenen yorum bölümünü tetikler
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(2)
 
             try:
-                possible_selectors = [
-                    "//a[contains(@href, '#comments')]",
-                    "//div[contains(text(), 'Değerlendirmeler')]",
-                    "//button[contains(text(), 'Değerlendirmeler')]",
-                    "//a[contains(text(), 'Yorumlar')]"
-                ]
-
-                clicked = False
-                for selector in possible_selectors:
-                    try:
-                        comments_tab = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((By.XPATH, selector))
-                        )
-                        self.driver.execute_script("arguments[0].click();", comments_tab)
-                        time.sleep(2)
-                        print("Yorumlar sekmesine geçildi")
-                        clicked = True
-                        break
-                    except:
-                        continue
+                comments_tab = WebDriverWait(self.driver, self.COMMENTS_TAB_TIMEOUT, poll_frequency=0.1).until(
+                    self._visible_comments_tab
+                )
+            except TimeoutException:
+                print("Yorumlar sekmesi bulunamadı, JSON-LD'den yorumlar çekilecek")
+                return
 
-                if not clicked:
-                    print("Yorumlar sekmesi bulunamadı, JSON-LD'den yorumlar çekilecek")
+            self.driver.execute_script("arguments[0].click();", comments_tab)
+            print("Yorumlar sekmesine geçildi")
 
-            except Exception as e:
-                print(f"Yorumlar sekmesi hatası: {str(e)}")
+            # Sekme yeni sayfa açabilir; ilk yorum kartı DOM'a eklenene kadar beklenir
+            try:
+                WebDriverWait(self.driver, self.READY_TIMEOUT, poll_frequency=0.1).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self._review_container_selector()))
+                )
+            except TimeoutException:
+                print("Yorum kartları henüz yüklenmedi, scroll ile denenecek")
 
         except Exception as e:
             print(f"Yorumlar bölümüne geçilirken hata: {str(e)}")
@@ -202,41 +845,8 @@ class TrendyolScraper:
                 self._extract_comments_from_html()
                 return
 
-            json_ld_data = self._extract_json_ld()
-
-            reviews_found = False
-            for data in json_ld_data:
-                if isinstance(data, dict):
-                    if data.get('@type') == 'Product' and 'review' in data:
-                        reviews = data.get('review', [])
-                        if not isinstance(reviews, list):
-                            reviews = [reviews]
-
-                        for review in reviews:
-                            if isinstance(review, dict) and review.get('@type') == 'Review':
-                                comment_data = {}
-
-                                author = review.get('author', {})
-                                if isinstance(author, dict):
-                                    comment_data['user'] = author.get('name', 'Anonim')
-                                else:
-                                    comment_data['user'] = str(author) if author else 'Anonim'
-
-                                comment_data['comment'] = review.get('reviewBody', '')
-
-                                date_published = review.get('datePublished', '')
-                                comment_data['date'] = date_published if date_published else 'Tarih yok'
-
-                                if comment_data['comment']:
-                                    is_duplicate = False
-                                    for existing_comment in self.comments:
-                                        if existing_comment.get('comment') == comment_data['comment']:
-                                            is_duplicate = True
-                                            break
-
-                                    if not is_duplicate:
-                                        self.comments.append(comment_data)
-                                        reviews_found = True
+            with self.metrics.phase('extraction'):
+                reviews_found = self._add_comments_from_json_ld(self._extract_json_ld())
 
             if reviews_found:
                 print(f"JSON-LD'den {len(self.comments)} yorum çekildi")
@@ -249,47 +859,138 @@ class TrendyolScraper:
             print("HTML'den yorumlar çekilmeye çalışılıyor...")
             self._extract_comments_from_html()
 
+    def _add_comments_from_json_ld(self, json_ld_data):
+        reviews_found = False
+        for data in json_ld_data:
+            if isinstance(data, dict):
+                if data.get('@type') == 'Product' and 'review' in data:
+                    reviews = data.get('review', [])
+                    if not isinstance(reviews, list):
+                        reviews = [reviews]
+
+                    for review in reviews:
+                        if isinstance(review, dict) and review.get('@type') == 'Review':
+                            comment_data = {}
+
+                            author = review.get('author', {})
+                            if isinstance(author, dict):
+                                comment_data['user'] = author.get('name', 'Anonim')
+                            else:
+                                comment_data['user'] = str(author) if author else 'Anonim'
+
+                            comment_data['comment'] = review.get('reviewBody', '')
+
+                            date_published = review.get('datePublished', '')
+                            comment_data['date'] = date_published if date_published else 'Tarih yok'
+
+                            if self._hits_watermark(self.comments, comment_data):
+                                print("Önceki çalıştırmada görülen yoruma ulaşıldı, artımlı çekim duruyor")
+                                return True
+
+                            self.metrics.incr('elements_seen')
+                            if comment_data['comment'] and self.comments.add(comment_data):
+                                self._remember_for_watermark(self.comments, comment_data)
+                                reviews_found = True
+
+        return reviews_found
+
     def _extract_comments_from_html(self):
         try:
             self._load_all_comments()
+            self._expand_truncated(self.COMMENT_ITEM_SELECTOR)
 
             print(f"\nYorumlar işlenmeye başlanıyor...")
             print(f"Hedef yorum sayısı: {self.max_comments if self.max_comments else 'Tümü'}")
 
-            possible_selectors = [
-                "div.review"
-            ]
+            with self.metrics.phase('extraction'):
+                processed = None
+                if self.extraction_engine in self.BULK_ENGINES:
+                    processed = self._extract_comments_in_bulk()
 
-            comment_elements = []
-            for selector in possible_selectors:
-                comment_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if comment_elements:
-                    print(f"'{selector}' ile {len(comment_elements)} yorum elementi bulundu")
-                    break
+                if processed is None:
+                    processed = self._extract_comments_from_elements()
 
-            if not comment_elements:
-                print("HTML'de yorum bulunamadı")
+            if processed is None:
                 return
 
-            comment_elements = comment_elements[2:] if len(comment_elements) > 2 else comment_elements
-            print(f"İşlenecek yorum elementi sayısı (filtrelemeden sonra): {len(comment_elements)}")
+            if self.max_comments and len(self.comments) < self.max_comments:
+                print(f"\n⚠ Uyarı: Hedef yorum sayısına ulaşılamadı. İstenen: {self.max_comments}, Çekilen: {len(self.comments)}")
+                print(f"Toplam {processed} element işlendi, {len(self.comments)} benzersiz yorum bulundu")
+            else:
+                print(f"\n✓ HTML'den toplam {len(self.comments)} yorum başarıyla çekildi")
 
-            for idx, comment_elem in enumerate(comment_elements, 1):
-                if self.max_comments and len(self.comments) >= self.max_comments:
-                    print(f"\n✓ Hedef yorum sayısına ulaşıldı: {len(self.comments)}/{self.max_comments}")
-                    break
+        except Exception as e:
+            print(f"HTML'den yorumlar çekilirken hata: {str(e)}")
+            self.metrics.incr('errors')
+
+    def _extract_comments_in_bulk(self):
+        """Yüklenen tüm yorumları tek seferde (snapshot veya script) çeker"""
+        rows = self._collect_rows(self.COMMENT_ITEM_SELECTOR, self.COMMENT_FIELD_SELECTORS)
+        if not rows:
+            print("Toplu çekimde yorum bulunamadı, element bazlı çekime geçiliyor")
+            return None
+
+        print(f"Toplu çekimle {len(rows)} yorum elementi okundu")
+        self.metrics.incr('elements_seen', len(rows))
+        if self.extraction_engine != 'network':
+            rows = rows[2:] if len(rows) > 2 else rows
+        print(f"İşlenecek yorum elementi sayısı (filtrelemeden sonra): {len(rows)}")
+
+        for idx, raw in enumerate(rows, 1):
+            if self.max_comments and len(self.comments) >= self.max_comments:
+                print(f"\n✓ Hedef yorum sayısına ulaşıldı: {len(self.comments)}/{self.max_comments}")
+                break
 
-                try:
+            self._processed_rows = idx
+            if raw is None:
+                continue
+
+            comment_data = self._build_comment_data(raw)
+            # Checkpoint'ten gelen kayıtlar sessizce geçilir
+            if idx <= self._resume_processed and comment_data in self.comments:
+                continue
+
+            self._add_comment(comment_data, idx)
+            self._save_checkpoint()
+            self._emit_progress('extraction')
+            if self.watermark_reached:
+                break
+
+        return len(rows)
+
+    def _extract_comments_from_elements(self):
+        """Element bazlı (yavaş) yol: her yorum için ayrı WebDriver çağrıları yapar"""
+        comment_elements = self.driver.find_elements(By.CSS_SELECTOR, self.COMMENT_ITEM_SELECTOR)
+        if not comment_elements:
+            print("HTML'de yorum bulunamadı")
+            return None
+
+        print(f"'{self.COMMENT_ITEM_SELECTOR}' ile {len(comment_elements)} yorum elementi bulundu")
+        self.metrics.incr('elements_seen', len(comment_elements))
+        comment_elements = comment_elements[2:] if len(comment_elements) > 2 else comment_elements
+        print(f"İşlenecek yorum elementi sayısı (filtrelemeden sonra): {len(comment_elements)}")
+
+        for idx, comment_elem in enumerate(comment_elements, 1):
+            # Element bazlı yol yavaş olduğundan çekim sırasındaki iptal burada da dinlenir
+            if self.cancel_event.is_set():
+                print("⛔ İptal edildi, element bazlı çekim durduruldu")
+                break
+
+            if self.max_comments and len(self.comments) >= self.max_comments:
+                print(f"\n✓ Hedef yorum sayısına ulaşıldı: {len(self.comments)}/{self.max_comments}")
+                break
+
+            try:
+                # Toplu genişletme çalıştıysa tek tek "Devamını oku" aramaya gerek yok
+                if self.expanded_count is None:
                     self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'auto', block: 'center'});", comment_elem)
                     time.sleep(0.2)
 
-                    comment_data = {}
-
                     try:
                         try:
                             read_more_button = comment_elem.find_element(By.XPATH, ".//a[contains(text(), 'Devamını oku')] | .//button[contains(text(), 'Devamını oku')] | .//span[contains(text(), 'Devamını oku')]")
                         except:
-                            read_more_button = comment_elem.find_element(By.CSS_SELECTOR, "a[class*='read-more'], button[class*='read-more'], [class*='show-more'], [class*='devamini-oku']")
+                            read_more_button = comment_elem.find_element(By.CSS_SELECTOR, self.READ_MORE_SELECTOR)
 
                         if read_more_button and read_more_button.is_displayed():
                             self.driver.execute_script("arguments[0].click();", read_more_button)
@@ -298,98 +999,514 @@ class TrendyolScraper:
                     except:
                         pass
 
-                    try:
-                        user_name = comment_elem.find_element(By.CSS_SELECTOR, ".name").text
-                        comment_data['user'] = ' '.join(user_name.split()) if user_name else "Anonim"
-                    except:
-                        comment_data['user'] = "Anonim"
+                raw = self._read_element_fields(comment_elem, self.COMMENT_FIELD_SELECTORS)
+                self._add_comment(self._build_comment_data(raw), idx)
+                self._processed_rows = idx
+                self._save_checkpoint()
+                self._emit_progress('extraction')
+                if self.watermark_reached:
+                    break
 
-                    try:
-                        review_comment = comment_elem.find_element(By.CSS_SELECTOR, "span.review-comment")
-                        comment_data['comment'] = review_comment.text.strip()
-                    except:
-                        comment_data['comment'] = ""
+            except Exception as e:
+                print(f"✗ Yorum {idx} çekilirken hata: {str(e)}")
+                self.metrics.incr('errors')
+                continue
+
+        return len(comment_elements)
+
+    def _collect_rows(self, item_selector, field_selectors):
+        if self._harvests_during_scroll():
+            return self._collect_pruned_rows(item_selector, field_selectors)
+        if self.extraction_engine == 'network':
+            return self._collect_network_rows(item_selector, field_selectors)
+        if self.extraction_engine == 'script':
+            return self._harvest_with_script(item_selector, field_selectors)
+        return self._parse_page_snapshot(item_selector, field_selectors)
+
+    # HARVEST_SCRIPT, PRUNE_HARVEST_SCRIPT ve EXPAND_SCRIPT'in ortak parçaları; script'ler bunlara kısa bir gövde ekler
+    READ_ROWS_JS = """
+        // Düğümlerin alanlarını okur; yorum alanı boş veya okunamayan düğümler skipped sayılır (okunamayan satır null)
+        const readRows = (nodes, fieldSelectors, commentField) => {
+            const rows = [];
+            let skipped = 0;
+            nodes.forEach(node => {
+                try {
+                    const row = {};
+                    for (const [field, selector] of Object.entries(fieldSelectors)) {
+                        const el = node.querySelector(selector);
+                        row[field] = el ? el.innerText : null;
+                    }
+                    if (!row[commentField] || !row[commentField].trim()) {
+                        skipped++;
+                    }
+                    rows.push(row);
+                } catch (e) {
+                    skipped++;
+                    rows.push(null);
+                }
+            });
+            return {rows: rows, skipped: skipped};
+        };
+    """
+
+    EXPAND_TRIGGERS_JS = """
+        // Düğümlerdeki görünür "Devamını oku" tetikleyicilerini tıklar; DOM settleMs boyunca durulunca
+        // (en geç timeoutMs sonra) callback tıklanan sayısıyla çağrılır
+        const expandTruncated = (nodes, fallbackSelector, settleMs, timeoutMs, callback) => {
+            const ownText = el => Array.from(el.childNodes).some(
+                n => n.nodeType === Node.TEXT_NODE && n.textContent.includes('Devamını oku')
+            );
+            const triggers = nodes
+                .map(node => Array.from(node.querySelectorAll('a, button, span')).find(ownText) || node.querySelector(fallbackSelector))
+                .filter(trigger => trigger && trigger.offsetParent !== null);
+            if (!triggers.length) return callback(0);
+
+            let quietTimer = null;
+            let hardTimer = null;
+            let clicked = 0;
+            const observer = new MutationObserver(() => {
+                clearTimeout(quietTimer);
+                quietTimer = setTimeout(finish, settleMs);
+            });
+            function finish() {
+                observer.disconnect();
+                clearTimeout(quietTimer);
+                clearTimeout(hardTimer);
+                callback(clicked);
+            }
+
+            observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+            triggers.forEach(trigger => {
+                try { trigger.click(); clicked++; } catch (e) {}
+            });
+            quietTimer = setTimeout(finish, settleMs);
+            hardTimer = setTimeout(finish, timeoutMs);
+        };
+    """
+
+    HARVEST_SCRIPT = READ_ROWS_JS + """
+        const [itemSelector, fieldSelectors, commentField, start] = arguments;
+        const nodes = Array.from(document.querySelectorAll(itemSelector)).slice(start);
+        return JSON.stringify(readRows(nodes, fieldSelectors, commentField));
+    """
+
+    def _run_harvest_script(self, item_selector, field_selectors, start=0):
+        """Tek bir execute_script ile start'tan itibaren tüm öğelerin alanlarını tarayıcı içinde okur"""
+        return json.loads(self.driver.execute_script(self.HARVEST_SCRIPT, item_selector, field_selectors, 'comment', start))
+
+    def _harvest_with_script(self, item_selector, field_selectors):
+        try:
+            result = self._run_harvest_script(item_selector, field_selectors)
+        except Exception as e:
+            print(f"Script ile toplu çekim başarısız: {str(e)}")
+            return None
+
+        self.skipped_nodes = result['skipped']
+        print(f"Script ile {len(result['rows'])} düğüm okundu, {self.skipped_nodes} düğüm atlandı (boş/hatalı)")
+        return result['rows']
+
+    # Henüz okunmamış düğümlerdeki "Devamını oku"lar açılır, alanlar okunur ve düğüm işaretlenir.
+    # prune ise düğümün içi de boşaltılır; düğüm ve yüksekliği yerinde kalır, scroll konumu, sayım ve
+    # sonsuz scroll tetikleyicisi bozulmaz.
+    PRUNE_HARVEST_SCRIPT = READ_ROWS_JS + EXPAND_TRIGGERS_JS + """
+        const [itemSelector, fieldSelectors, commentField, readMoreSelector, settleMs, timeoutMs, prune] = arguments;
+        const done = arguments[arguments.length - 1];
+        const nodes = Array.from(document.querySelectorAll(itemSelector)).filter(node => !node.hasAttribute('data-harvested'));
+
+        expandTruncated(nodes, readMoreSelector, settleMs, timeoutMs, () => {
+            const result = readRows(nodes, fieldSelectors, commentField);
+
+            // Önce tüm yükseklikler okunur, sonra yazılır (tek layout hesabı)
+            const heights = prune ? nodes.map(node => node.offsetHeight) : [];
+            nodes.forEach((node, i) => {
+                node.setAttribute('data-harvested', '1');
+                if (!prune) return;
+                node.style.height = heights[i] + 'px';
+                node.replaceChildren();
+            });
+            done(JSON.stringify(result));
+        });
+    """
+
+    def _prunes_dom(self):
+        return self.prune_dom and self.extraction_engine in ('snapshot', 'script')
+
+    def _harvests_during_scroll(self):
+        """prune_dom veya checkpoint açıksa yeni düğümler her scroll'da okunur; checkpoint'ler gerçek satır taşır"""
+        return self.extraction_engine in ('snapshot', 'script') and (self.prune_dom or self._checkpoint_target is not None)
+
+    def _prune_harvest(self, item_selector, field_selectors):
+        """Yeni yüklenen düğümleri okur (prune_dom ise boşaltır); satırlar sırayla _pruned_rows'a eklenir"""
+        try:
+            result = json.loads(self.driver.execute_async_script(
+                self.PRUNE_HARVEST_SCRIPT, item_selector, field_selectors, 'comment',
+                self.READ_MORE_SELECTOR, self.EXPAND_SETTLE_MS, self.EXPAND_TIMEOUT_MS, self._prunes_dom()
+            ))
+        except Exception as e:
+            print(f"Yeni düğümler okunamadı: {str(e)}")
+            return
 
-                    try:
-                        date = comment_elem.find_element(By.CSS_SELECTOR, ".date").text
-                        comment_data['date'] = ' '.join(date.split()) if date else "Tarih yok"
-                    except:
-                        comment_data['date'] = "Tarih yok"
-
-                    if comment_data['comment']:
-                        is_duplicate = False
-                        for existing_comment in self.comments:
-                            if existing_comment.get('comment') == comment_data['comment']:
-                                is_duplicate = True
-                                print(f"Yorum {idx} tekrar ediyor (aynı metin), atlanıyor")
-                                break
-
-                        if not is_duplicate:
-                            self.comments.append(comment_data)
-                            print(f"✓ Yorum {idx} eklendi (Toplam: {len(self.comments)})")
-                    else:
-                        print(f"Yorum {idx} boş veya çekilemedi, atlanıyor")
+        rows = result['rows']
+        # resume: checkpoint'teki satırlara karşılık gelen (yeniden yüklenen) düğümler atlanır
+        if self._resume_skip_rows:
+            dropped = min(self._resume_skip_rows, len(rows))
+            rows = rows[dropped:]
+            self._resume_skip_rows -= dropped
+
+        self._pruned_rows.extend(rows)
+        self.skipped_nodes += result['skipped']
+
+    def _collect_pruned_rows(self, item_selector, field_selectors):
+        self._prune_harvest(item_selector, field_selectors)
+        action = "okunup boşaltıldı" if self._prunes_dom() else "okundu"
+        print(f"Scroll sırasında {len(self._pruned_rows)} düğüm {action}, {self.skipped_nodes} düğüm atlandı (boş/hatalı)")
+        return self._pruned_rows
+
+    def _collect_network_rows(self, item_selector, field_selectors):
+        """Scroll sırasında yakalanan review JSON yanıtlarını ham alan sözlüklerine çevirir.
+
+        İlk parti XHR ile değil sayfa HTML'iyle gelir; ağda görülmeyen DOM satırları başa eklenir.
+        Ağ satırları review_id ile, DOM satırları normalize edilmiş metinle tekilleştirilir.
+        """
+        self._capture_review_payloads()
+        print(f"Ağ trafiğinden {len(self._review_payloads)} değerlendirme yanıtı yakalandı")
+
+        rows = []
+        seen_ids = set()
+        for payload in self._review_payloads:
+            for item in self._iter_review_objects(payload):
+                raw = {field: self._pick_network_field(item, keys) for field, keys in self.NETWORK_FIELD_KEYS.items()}
+                raw['name'] = raw['user']
+                if raw['review_id'] is not None:
+                    if raw['review_id'] in seen_ids:
+                        continue
+                    seen_ids.add(raw['review_id'])
+                rows.append(raw)
+
+        dom_rows = self._parse_page_snapshot(item_selector, field_selectors)
+        if dom_rows is None:
+            dom_rows = self._harvest_with_script(item_selector, field_selectors) or []
+        if item_selector == self.COMMENT_ITEM_SELECTOR and len(dom_rows) > 2:
+            dom_rows = dom_rows[2:]
+
+        network_texts = {ReviewStore._normalize(raw['comment']) for raw in rows}
+        initial = [raw for raw in dom_rows if raw and ReviewStore._normalize(raw.get('comment')) not in network_texts]
+        if initial:
+            print(f"Sayfa HTML'inden ağda görülmeyen {len(initial)} satır eklendi")
+        return initial + rows
+
+    def _drain_performance_log(self):
+        """Performance log'u okur: engellenen istekleri sayar, review JSON yanıtlarının id'lerini saklar"""
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            print(f"Performance log okunamadı: {str(e)}")
+            return
 
-                except Exception as e:
-                    print(f"✗ Yorum {idx} çekilirken hata: {str(e)}")
-                    continue
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
 
-            if self.max_comments and len(self.comments) < self.max_comments:
-                print(f"\n⚠ Uyarı: Hedef yorum sayısına ulaşılamadı. İstenen: {self.max_comments}, Çekilen: {len(self.comments)}")
-                print(f"Toplam {len(comment_elements)} element işlendi, {len(self.comments)} benzersiz yorum bulundu")
-            else:
-                print(f"\n✓ HTML'den toplam {len(self.comments)} yorum başarıyla çekildi")
+            method = message.get('method')
+            params = message.get('params', {})
 
-        except Exception as e:
-            print(f"HTML'den yorumlar çekilirken hata: {str(e)}")
+            if method == 'Network.loadingFailed' and params.get('blockedReason'):
+                self.blocked_requests += 1
+            elif method == 'Network.responseReceived':
+                response = params.get('response', {})
+                if 'json' in response.get('mimeType', '') and self.REVIEW_API_PATTERN.search(response.get('url', '')):
+                    self._review_request_ids.append(params['requestId'])
 
-    def _load_all_comments(self):
-        max_scrolls = 200 
-        scrolls = 0
-        no_new_comments_count = 0  
+    def _capture_review_payloads(self):
+        """Yeni review XHR yanıtlarının gövdelerini CDP üzerinden okuyup _review_payloads'a ekler.
 
-        print("Infinite scroll ile yorumlar yükleniyor...")
+        Her scroll'da çağrılır; böylece uzun çekimlerde log taşmadan ve tarayıcı eski yanıt gövdelerini atmadan okunur.
+        """
+        self._drain_performance_log()
 
-        while scrolls < max_scrolls:
+        captured = 0
+        for request_id in self._review_request_ids:
             try:
-                previous_count = len(self.driver.find_elements(By.CSS_SELECTOR, "div.review"))
-
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1.5)  
+                body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                text = base64.b64decode(body['body']).decode('utf-8') if body.get('base64Encoded') else body['body']
+                self._review_payloads.append(json.loads(text))
+                captured += 1
+            except Exception:
+                continue
+        self._review_request_ids = []
+        return captured
+
+    def _measure_page_weight(self):
+        """Resource Timing'e göre indirilen byte'ları ve (lean modda) engellenen istek sayısını raporlar"""
+        try:
+            weight = self.driver.execute_script("""
+                const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+                return {bytes: entries.reduce((sum, e) => sum + (e.transferSize || 0), 0), count: entries.length};
+            """)
+        except Exception as e:
+            print(f"Sayfa ağırlığı ölçülemedi: {str(e)}")
+            return
 
-                current_count = len(self.driver.find_elements(By.CSS_SELECTOR, "div.review"))
+        if self._performance_logging:
+            self._drain_performance_log()
+
+        self.page_weight = {
+            'transferred_bytes': weight['bytes'],
+            'resources': weight['count'],
+            'blocked_requests': self.blocked_requests,
+        }
+        print(f"Sayfa ağırlığı: {weight['bytes'] / 1024:.0f} KB indirildi ({weight['count']} kaynak), "
+              f"{self.blocked_requests} istek engellendi")
+
+    def _iter_review_objects(self, payload):
+        """JSON yanıtında yorum metni alanı taşıyan nesneleri sırayla bulur"""
+        if isinstance(payload, list):
+            for item in payload:
+                yield from self._iter_review_objects(item)
+        elif isinstance(payload, dict):
+            if any(isinstance(payload.get(key), str) for key in self.NETWORK_FIELD_KEYS['comment']):
+                yield payload
+                return
+            for value in payload.values():
+                if isinstance(value, (dict, list)):
+                    yield from self._iter_review_objects(value)
+
+    @staticmethod
+    def _pick_network_field(item, keys):
+        for key in keys:
+            value = item.get(key)
+            if isinstance(value, dict):
+                value = value.get('name')
+            if value in (None, ''):
+                continue
+
+            # Milisaniye cinsinden zaman damgaları okunur tarihe çevrilir
+            if key in ('createdDate', 'lastModifiedDate') and isinstance(value, (int, float)):
+                return datetime.fromtimestamp(value / 1000).strftime('%d.%m.%Y')
+            # Sayısal id/puan/tarih alanları da DOM satırları gibi metin olarak döner (normalize edilebilsin)
+            return value if isinstance(value, str) else str(value)
+        return None
+
+    def _parse_page_snapshot(self, item_selector, field_selectors):
+        """page_source'u bir kez alıp lxml ile ayrıştırır; her öğe için ham alan metinlerini döner"""
+        if lxml_html is None:
+            print("lxml yüklü değil, element bazlı çekime geçiliyor")
+            return None
 
-                scrolls += 1
+        try:
+            tree = lxml_html.fromstring(self.driver.page_source)
+        except Exception as e:
+            print(f"Sayfa görüntüsü ayrıştırılamadı: {str(e)}")
+            return None
 
-                if current_count > previous_count:
-                    new_comments = current_count - previous_count
-                    print(f"Scroll #{scrolls}: {new_comments} yeni yorum yüklendi (Toplam: {current_count})")
-                    no_new_comments_count = 0
-                else:
-                    no_new_comments_count += 1
-                    print(f"Scroll #{scrolls}: Yeni yorum yok (Toplam: {current_count})")
+        field_paths = {field: _compiled_xpath(selector, relative=True) for field, selector in field_selectors.items()}
 
-                if no_new_comments_count >= 5:
-                    print(f"\n5 kez üst üste yeni yorum gelmedi. Tüm yorumlar yüklendi (Toplam: {current_count})")
-                    break
+        rows = []
+        for node in _compiled_xpath(item_selector)(tree):
+            raw = {}
+            for field, path in field_paths.items():
+                matches = path(node)
+                raw[field] = _inner_text(matches[0]) if matches else None
+            rows.append(raw)
 
-                if self.max_comments and current_count >= self.max_comments * 2:
-                    print(f"\nYeterli yorum yüklendi ({current_count}). Hedef: {self.max_comments}")
-                    break
+        return rows
 
+    def _read_element_fields(self, element, field_selectors):
+        raw = {}
+        for field, selector in field_selectors.items():
+            try:
+                raw[field] = element.find_element(By.CSS_SELECTOR, selector).text
+            except:
+                raw[field] = None
+        return raw
+
+    @staticmethod
+    def _normalize_text(text, placeholder):
+        text = ' '.join(text.split()) if text else ''
+        return text if text else placeholder
+
+    def _build_comment_data(self, raw):
+        comment_data = {
+            'user': self._normalize_text(raw.get('user'), "Anonim"),
+            'comment': (raw.get('comment') or '').strip(),
+            'date': self._normalize_text(raw.get('date'), "Tarih yok"),
+        }
+        self._add_network_extras(comment_data, raw)
+        return comment_data
+
+    def _build_review_data(self, raw):
+        review_data = {
+            'seller': self._normalize_text(raw.get('seller'), "Satıcı bulunamadı"),
+            'product': self._normalize_text(raw.get('product'), "Ürün bulunamadı"),
+            'comment': (raw.get('comment') or '').strip(),
+            'name': self._normalize_text(raw.get('name'), "Anonim"),
+            'date': self._normalize_text(raw.get('date'), "Tarih yok"),
+        }
+        self._add_network_extras(review_data, raw)
+        return review_data
+
+    @staticmethod
+    def _add_network_extras(data, raw):
+        # Sadece ağ yakalama modunda gelen zengin alanlar
+        if raw.get('rating') is not None:
+            data['rating'] = str(raw['rating'])
+        if raw.get('review_id') is not None:
+            data['review_id'] = str(raw['review_id'])
+
+    def _add_comment(self, comment_data, idx):
+        if not comment_data['comment']:
+            print(f"Yorum {idx} boş veya çekilemedi, atlanıyor")
+            self.metrics.incr('empty_reviews')
+            return False
+
+        if self._hits_watermark(self.comments, comment_data):
+            print(f"Yorum {idx} önceki çalıştırmada görüldü, artımlı çekim burada duruyor")
+            return False
+
+        if not self.comments.add(comment_data):
+            print(f"Yorum {idx} tekrar ediyor (aynı metin), atlanıyor")
+            self.metrics.incr('duplicates')
+            return False
+
+        self._remember_for_watermark(self.comments, comment_data)
+        print(f"✓ Yorum {idx} eklendi (Toplam: {len(self.comments)})")
+        return True
+
+    def _add_review(self, review_data, idx):
+        if not review_data['comment']:
+            print(f"Değerlendirme {idx} boş veya çekilemedi, atlanıyor")
+            self.metrics.incr('empty_reviews')
+            return False
+
+        if self._hits_watermark(self.reviews, review_data):
+            print(f"Değerlendirme {idx} önceki çalıştırmada görüldü, artımlı çekim burada duruyor")
+            return False
+
+        if not self.reviews.add(review_data):
+            print(f"Değerlendirme {idx} tekrar ediyor (aynı metin), atlanıyor")
+            self.metrics.incr('duplicates')
+            return False
+
+        self._remember_for_watermark(self.reviews, review_data)
+        print(f"✓ Değerlendirme {idx} eklendi (Toplam: {len(self.reviews)})")
+        return True
+
+    @staticmethod
+    def _watermark_token(store, record):
+        return hashlib.blake2b(repr(store.make_key(record)).encode('utf-8'), digest_size=16).hexdigest()
+
+    def _hits_watermark(self, store, record):
+        if self._watermark and self._watermark_token(store, record) in self._watermark:
+            self.watermark_reached = True
+            return True
+        return False
+
+    def _remember_for_watermark(self, store, record):
+        if self.incremental and len(self._new_watermark) < self.WATERMARK_SIZE:
+            self._new_watermark.append(self._watermark_token(store, record))
+
+    def _make_watermark_check(self, item_selector, field_selectors, build, store):
+        """Scroll sırasında yeni yüklenen düğümlerde önceki çalıştırmadan bilinen kayıt olup olmadığını kontrol eden fonksiyon"""
+        if not self._watermark:
+            return None
+
+        def check():
+            try:
+                result = self._run_harvest_script(item_selector, field_selectors, start=self._watermark_checked)
             except Exception as e:
-                print(f"Scroll hatası: {str(e)}")
-                break
+                print(f"Watermark kontrolü yapılamadı: {str(e)}")
+                return False
 
-        final_count = len(self.driver.find_elements(By.CSS_SELECTOR, "div.review"))
-        print(f"\nScroll tamamlandı. Toplam {final_count} yorum yüklendi ({scrolls} scroll)")
+            self._watermark_checked += len(result['rows'])
+            for raw in result['rows']:
+                if raw is None:
+                    continue
+                record = build(raw)
+                if record['comment'] and self._watermark_token(store, record) in self._watermark:
+                    return True
+            return False
+
+        return check
+
+    # Scroll sonrası yeni düğüm gelene kadar (veya zaman aşımına kadar) tarayıcı içinde bekler
+    SCROLL_WAIT_SCRIPT = """
+        const [selector, container, timeoutMs, loaderSelector] = arguments;
+        const done = arguments[arguments.length - 1];
+        const start = performance.now();
+        const before = document.querySelectorAll(selector).length;
+        let finished = false;
+        let observer = null;
+        let timer = null;
+
+        const finish = (reason) => {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            clearTimeout(timer);
+            // Gösterge sadece listenin çevresinde aranır (kaydırılan kutu veya listenin üst öğesi); sayfadaki
+            // ilgisiz yükleniyor öğeleri ve kartların içindekiler (tembel görseller vb.) sayılmaz
+            const items = document.querySelectorAll(selector);
+            const list = items.length ? items[items.length - 1].parentElement : null;
+            const scope = container || (list && list.parentElement) || document;
+            const loaderVisible = Array.from(scope.querySelectorAll(loaderSelector)).some(
+                el => el.offsetParent !== null && !el.closest(selector)
+            );
+            done({
+                before: before,
+                after: document.querySelectorAll(selector).length,
+                elapsed: performance.now() - start,
+                reason: reason,
+                loader_visible: loaderVisible
+            });
+        };
+
+        observer = new MutationObserver(() => {
+            if (document.querySelectorAll(selector).length > before) finish('new');
+        });
+        observer.observe(document.body, {childList: true, subtree: true});
+        timer = setTimeout(() => finish('timeout'), timeoutMs);
+
+        if (container) {
+            container.scrollTop = container.scrollHeight;
+        } else {
+            window.scrollTo(0, document.body.scrollHeight);
+        }
+    """
+
+    EXPAND_SCRIPT = EXPAND_TRIGGERS_JS + """
+        const [itemSelector, fallbackSelector, settleMs, timeoutMs] = arguments;
+        const done = arguments[arguments.length - 1];
+        expandTruncated(Array.from(document.querySelectorAll(itemSelector)), fallbackSelector, settleMs, timeoutMs, done);
+    """
+
+    @timed_phase('expansion')
+    def _expand_truncated(self, item_selector):
+        """Tüm kısaltılmış yorumları tek script çağrısında genişletir, DOM durulana kadar bir kez bekler"""
+        try:
+            self.expanded_count = self.driver.execute_async_script(
+                self.EXPAND_SCRIPT, item_selector, self.READ_MORE_SELECTOR, self.EXPAND_SETTLE_MS, self.EXPAND_TIMEOUT_MS
+            )
+            print(f"'Devamını oku' ile {self.expanded_count} yorum genişletildi")
+        except Exception as e:
+            self.expanded_count = None
+            print(f"Toplu genişletme başarısız, element bazlı denenecek: {str(e)}")
+
+    @timed_phase('scroll')
+    def _load_all_comments(self):
+        print("Infinite scroll ile yorumlar yükleniyor...")
+        stop_check = self._make_watermark_check(
+            self.COMMENT_ITEM_SELECTOR, self.COMMENT_FIELD_SELECTORS, self._build_comment_data, self.comments
+        )
+        self._scroll_until_loaded(
+            self.COMMENT_ITEM_SELECTOR, None, "yorum", expected_total=self._expected_comment_total(), stop_check=stop_check,
+            field_selectors=self.COMMENT_FIELD_SELECTORS
+        )
 
+    @timed_phase('scroll')
     def _load_all_reviews(self):
         """INFINITE SCROLL: review-list-scroll-container içinde scroll ederek tüm değerlendirmeleri yükler"""
-        max_scrolls = 200
-        scrolls = 0
-        no_new_reviews_count = 0 
-
         print("Infinite scroll ile değerlendirmeler yükleniyor...")
 
         try:
@@ -398,70 +1515,204 @@ class TrendyolScraper:
             print("review-list-scroll-container bulunamadı, normal scroll kullanılacak")
             scroll_container = None
 
-        while scrolls < max_scrolls:
-            try:
-                previous_count = len(self.driver.find_elements(By.CSS_SELECTOR, ".review-list .review"))
+        stop_check = self._make_watermark_check(
+            self.REVIEW_ITEM_SELECTOR, self.REVIEW_FIELD_SELECTORS, self._build_review_data, self.reviews
+        )
+        self._scroll_until_loaded(
+            self.REVIEW_ITEM_SELECTOR, scroll_container, "değerlendirme", stop_check=stop_check,
+            field_selectors=self.REVIEW_FIELD_SELECTORS
+        )
+
+    def _scroll_until_loaded(self, item_selector, scroll_container, noun, expected_total=None, stop_check=None,
+                             field_selectors=None):
+        """Sabit bekleme yerine DOM'a yeni düğüm eklenmesini bekleyerek scroll eder.
+
+        Bekleme süresi ölçülen gecikmelere göre uyarlanır. Sayfa sonu; öğe sayısı
+        expected_total'a (JSON-LD reviewCount) ulaştığında veya listenin çevresinde yükleniyor
+        göstergesi yokken SCROLL_IDLE_LIMIT kez üst üste kısa bekleme boşa çıktığında algılanır;
+        sadece gösterge görünürken SCROLL_MAX_TIMEOUT kadar beklenir. stop_check verilirse (artımlı mod) yeni düğümler
+        geldikçe çağrılır ve True dönerse scroll durur. prune_dom veya checkpoint açıksa yeni düğümler
+        her scroll'da field_selectors ile okunur (prune_dom ise boşaltılır).
+        """
+        harvest = field_selectors is not None and self._harvests_during_scroll()
+        if stop_check and stop_check():
+            print(f"Önceki çalıştırmada görülen {noun} zaten sayfada, scroll gerekmiyor")
+            return
 
-                if scroll_container:
-                    self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", scroll_container)
+        scrolls = 0
+        no_new_count = 0
+        idle_timeouts = 0
+        timeout = self.SCROLL_INITIAL_TIMEOUT
+        current_count = 0
+        self.scroll_latencies = []
+
+        while scrolls < self.SCROLL_MAX:
+            if self._check_cancelled():
+                # Yüklenenler yine işlenir; çekim sırasında yeni bir iptal isteği dinlenebilsin diye olay sıfırlanır
+                self.cancel_event.clear()
+                break
+
+            try:
+                result = self.driver.execute_async_script(
+                    self.SCROLL_WAIT_SCRIPT, item_selector, scroll_container, int(timeout * 1000), self.LOADER_SELECTOR
+                )
+                scrolls += 1
+                self.metrics.incr('scrolls')
+
+                current_count = result['after']
+                self._loaded_count = current_count
+                latency = result['elapsed'] / 1000
+
+                if current_count > result['before']:
+                    self.scroll_latencies.append(latency)
+                    print(f"Scroll #{scrolls}: {current_count - result['before']} yeni {noun} yüklendi (Toplam: {current_count}, {latency:.2f} sn)")
+                    no_new_count = 0
+                    idle_timeouts = 0
+                    timeout = self._adapt_scroll_timeout()
                 else:
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    no_new_count += 1
+                    # Gösterge görünüyorsa parti yolda: bir sonraki tur tam süre beklenir. Görünmüyorsa
+                    # uyarlanmış kısa süreyle boşta sayılır; liste sonunda boşa geçen süre bu yüzden kısadır
+                    if result['loader_visible']:
+                        idle_timeouts = 0
+                        timeout = self.SCROLL_MAX_TIMEOUT
+                    else:
+                        idle_timeouts += 1
+                        timeout = self._adapt_scroll_timeout() if self.scroll_latencies else self.SCROLL_INITIAL_TIMEOUT
+                    print(f"Scroll #{scrolls}: Yeni {noun} yok (Toplam: {current_count}, {latency:.2f} sn)")
 
-                time.sleep(1.5) 
+                if stop_check and current_count > result['before'] and stop_check():
+                    print(f"\nÖnceki çalıştırmada görülen bir {noun} yüklendi, scroll durduruluyor (Toplam: {current_count})")
+                    break
 
-                current_count = len(self.driver.find_elements(By.CSS_SELECTOR, ".review-list .review"))
+                if harvest and current_count > result['before']:
+                    self._prune_harvest(item_selector, field_selectors)
 
-                scrolls += 1
+                if self.extraction_engine == 'network':
+                    self._capture_review_payloads()
 
-                if current_count > previous_count:
-                    new_reviews = current_count - previous_count
-                    print(f"Scroll #{scrolls}: {new_reviews} yeni değerlendirme yüklendi (Toplam: {current_count})")
-                    no_new_reviews_count = 0 
-                else:
-                    no_new_reviews_count += 1
-                    print(f"Scroll #{scrolls}: Yeni değerlendirme yok (Toplam: {current_count})")
+                self._save_checkpoint()
+                self._emit_progress('scroll', loaded=current_count, scrolls=scrolls, force=True)
+
+                if expected_total and current_count >= expected_total:
+                    print(f"\nSayfadaki {noun} sayısı beklenen toplama ulaştı ({current_count}/{expected_total})")
+                    break
 
-                if no_new_reviews_count >= 5:
-                    print(f"\n5 kez üst üste yeni değerlendirme gelmedi. Tümü yüklendi (Toplam: {current_count})")
+                if idle_timeouts >= self.SCROLL_IDLE_LIMIT:
+                    print(f"\nYükleniyor göstergesi yok ve yeni {noun} gelmiyor. Liste sonu (Toplam: {current_count})")
+                    break
+
+                if no_new_count >= self.SCROLL_EMPTY_LIMIT:
+                    print(f"\n{self.SCROLL_EMPTY_LIMIT} kez üst üste yeni {noun} gelmedi. Tümü yüklendi (Toplam: {current_count})")
                     break
 
                 if self.max_comments and current_count >= self.max_comments * 2:
-                    print(f"\nYeterli değerlendirme yüklendi ({current_count}). Hedef: {self.max_comments}")
+                    print(f"\nYeterli {noun} yüklendi ({current_count}). Hedef: {self.max_comments}")
                     break
 
             except Exception as e:
                 print(f"Scroll hatası: {str(e)}")
+                self.metrics.incr('errors')
+                self.scroll_interrupted = True
+                self._save_checkpoint(force=True)
                 break
 
-        final_count = len(self.driver.find_elements(By.CSS_SELECTOR, ".review-list .review"))
-        print(f"\nScroll tamamlandı. Toplam {final_count} değerlendirme yüklendi ({scrolls} scroll)")
+        print(f"\nScroll tamamlandı. Toplam {current_count} {noun} yüklendi ({scrolls} scroll)")
+        if self.scroll_latencies:
+            average = sum(self.scroll_latencies) / len(self.scroll_latencies)
+            print(f"Scroll gecikmesi: ortalama {average:.2f} sn, en fazla {max(self.scroll_latencies):.2f} sn")
+
+    def _adapt_scroll_timeout(self):
+        """Son gecikmelerin birkaç katı kadar bekler; sınırlar SCROLL_MIN/MAX_TIMEOUT"""
+        recent = sorted(self.scroll_latencies[-10:])
+        median = recent[len(recent) // 2]
+        return min(max(median * 3, self.SCROLL_MIN_TIMEOUT), self.SCROLL_MAX_TIMEOUT)
 
     def _extract_reviews_from_html(self):
         try:
             self._load_all_reviews()
+            self._expand_truncated(self.REVIEW_ITEM_SELECTOR)
 
             print(f"\nDeğerlendirmeler işlenmeye başlanıyor...")
             print(f"Hedef değerlendirme sayısı: {self.max_comments if self.max_comments else 'Tümü'}")
 
-            review_elements = self.driver.find_elements(By.CSS_SELECTOR, ".review-list .review")
+            with self.metrics.phase('extraction'):
+                processed = None
+                if self.extraction_engine in self.BULK_ENGINES:
+                    processed = self._extract_reviews_in_bulk()
 
-            if not review_elements:
-                print("Değerlendirme bulunamadı")
+                if processed is None:
+                    processed = self._extract_reviews_from_elements()
+
+            if processed is None:
                 return
 
-            print(f"İşlenecek değerlendirme elementi sayısı: {len(review_elements)}")
+            if self.max_comments and len(self.reviews) < self.max_comments:
+                print(f"\n⚠ Uyarı: Hedef değerlendirme sayısına ulaşılamadı. İstenen: {self.max_comments}, Çekilen: {len(self.reviews)}")
+                print(f"Toplam {processed} element işlendi, {len(self.reviews)} benzersiz değerlendirme bulundu")
+            else:
+                print(f"\n✓ Toplam {len(self.reviews)} değerlendirme başarıyla çekildi")
 
-            for idx, review_elem in enumerate(review_elements, 1):
-                if self.max_comments and len(self.reviews) >= self.max_comments:
-                    print(f"\n✓ Hedef değerlendirme sayısına ulaşıldı: {len(self.reviews)}/{self.max_comments}")
-                    break
+        except Exception as e:
+            print(f"Değerlendirmeler çekilirken hata: {str(e)}")
+            self.metrics.incr('errors')
 
-                try:
+    def _extract_reviews_in_bulk(self):
+        """Yüklenen tüm değerlendirmeleri tek seferde (snapshot veya script) çeker"""
+        rows = self._collect_rows(self.REVIEW_ITEM_SELECTOR, self.REVIEW_FIELD_SELECTORS)
+        if not rows:
+            print("Toplu çekimde değerlendirme bulunamadı, element bazlı çekime geçiliyor")
+            return None
+
+        self.metrics.incr('elements_seen', len(rows))
+        print(f"İşlenecek değerlendirme elementi sayısı: {len(rows)}")
+
+        for idx, raw in enumerate(rows, 1):
+            if self.max_comments and len(self.reviews) >= self.max_comments:
+                print(f"\n✓ Hedef değerlendirme sayısına ulaşıldı: {len(self.reviews)}/{self.max_comments}")
+                break
+
+            self._processed_rows = idx
+            if raw is None:
+                continue
+
+            review_data = self._build_review_data(raw)
+            if idx <= self._resume_processed and review_data in self.reviews:
+                continue
+
+            self._add_review(review_data, idx)
+            self._save_checkpoint()
+            self._emit_progress('extraction')
+            if self.watermark_reached:
+                break
+
+        return len(rows)
+
+    def _extract_reviews_from_elements(self):
+        """Element bazlı (yavaş) yol: her değerlendirme için ayrı WebDriver çağrıları yapar"""
+        review_elements = self.driver.find_elements(By.CSS_SELECTOR, self.REVIEW_ITEM_SELECTOR)
+
+        if not review_elements:
+            print("Değerlendirme bulunamadı")
+            return None
+
+        self.metrics.incr('elements_seen', len(review_elements))
+        print(f"İşlenecek değerlendirme elementi sayısı: {len(review_elements)}")
+
+        for idx, review_elem in enumerate(review_elements, 1):
+            if self.cancel_event.is_set():
+                print("⛔ İptal edildi, element bazlı çekim durduruldu")
+                break
+
+            if self.max_comments and len(self.reviews) >= self.max_comments:
+                print(f"\n✓ Hedef değerlendirme sayısına ulaşıldı: {len(self.reviews)}/{self.max_comments}")
+                break
+
+            try:
+                if self.expanded_count is None:
                     self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'auto', block: 'center'});", review_elem)
                     time.sleep(0.2)
 
-                    review_data = {}
-
                     try:
                         read_more_button = review_elem.find_element(By.XPATH, ".//a[contains(text(), 'Devamını oku')] | .//button[contains(text(), 'Devamını oku')] | .//span[contains(text(), 'Devamını oku')]")
                         if read_more_button and read_more_button.is_displayed():
@@ -469,64 +1720,22 @@ class TrendyolScraper:
                             time.sleep(0.5)
                             print(f"Değerlendirme {idx} için 'Devamını oku' butonuna tıklandı")
                     except:
-                        pass  
-
-                    try:
-                        seller = review_elem.find_element(By.CSS_SELECTOR, ".item-header .seller")
-                        review_data['seller'] = ' '.join(seller.text.split()).strip() if seller.text else "Satıcı bulunamadı"
-                    except:
-                        review_data['seller'] = "Satıcı bulunamadı"
-
-                    try:
-                        product = review_elem.find_element(By.CSS_SELECTOR, ".item-header .product")
-                        review_data['product'] = ' '.join(product.text.split()).strip() if product.text else "Ürün bulunamadı"
-                    except:
-                        review_data['product'] = "Ürün bulunamadı"
-
-                    try:
-                        comment = review_elem.find_element(By.CSS_SELECTOR, ".review-info .name-wrapper .comment")
-                        review_data['comment'] = comment.text.strip() if comment.text else ""
-                    except:
-                        review_data['comment'] = ""
-
-                    try:
-                        name = review_elem.find_element(By.CSS_SELECTOR, ".review-info .review-info-detail .name")
-                        review_data['name'] = ' '.join(name.text.split()).strip() if name.text else "Anonim"
-                    except:
-                        review_data['name'] = "Anonim"
-
-                    try:
-                        date = review_elem.find_element(By.CSS_SELECTOR, ".review-info .review-info-detail .date")
-                        review_data['date'] = ' '.join(date.text.split()).strip() if date.text else "Tarih yok"
-                    except:
-                        review_data['date'] = "Tarih yok"
-
-                    if review_data['comment']:
-                        is_duplicate = False
-                        for existing_review in self.reviews:
-                            if existing_review.get('comment') == review_data['comment']:
-                                is_duplicate = True
-                                print(f"Değerlendirme {idx} tekrar ediyor (aynı metin), atlanıyor")
-                                break
-
-                        if not is_duplicate:
-                            self.reviews.append(review_data)
-                            print(f"✓ Değerlendirme {idx} eklendi (Toplam: {len(self.reviews)})")
-                    else:
-                        print(f"Değerlendirme {idx} boş veya çekilemedi, atlanıyor")
+                        pass
 
-                except Exception as e:
-                    print(f"✗ Değerlendirme {idx} çekilirken hata: {str(e)}")
-                    continue
+                raw = self._read_element_fields(review_elem, self.REVIEW_FIELD_SELECTORS)
+                self._add_review(self._build_review_data(raw), idx)
+                self._processed_rows = idx
+                self._save_checkpoint()
+                self._emit_progress('extraction')
+                if self.watermark_reached:
+                    break
 
-            if self.max_comments and len(self.reviews) < self.max_comments:
-                print(f"\n⚠ Uyarı: Hedef değerlendirme sayısına ulaşılamadı. İstenen: {self.max_comments}, Çekilen: {len(self.reviews)}")
-                print(f"Toplam {len(review_elements)} element işlendi, {len(self.reviews)} benzersiz değerlendirme bulundu")
-            else:
-                print(f"\n✓ Toplam {len(self.reviews)} değerlendirme başarıyla çekildi")
+            except Exception as e:
+                print(f"✗ Değerlendirme {idx} çekilirken hata: {str(e)}")
+                self.metrics.incr('errors')
+                continue
 
-        except Exception as e:
-            print(f"Değerlendirmeler çekilirken hata: {str(e)}")
+        return len(review_elements)
 
     def _extract_rating(self, rating_class):
         try:
@@ -544,7 +1753,141 @@ class TrendyolScraper:
         except:
             return "N/A"
 
+    def _group_reviews_by_product(self):
+        products_dict = {}
+        for review in self.reviews:
+            product_name = review.get('product', 'Bilinmiyor')
+            if product_name not in products_dict:
+                products_dict[product_name] = []
+            products_dict[product_name].append(review)
+
+        return products_dict
+
+    @timed_phase('export')
+    def export_to_word_bulk(self, filename="trendyol_yorumlar.docx", split_by_product=False, max_items_per_file=None):
+        """On binlerce kayıt için hızlı Word çıktısı: WordprocessingML tek geçişte doğrudan yazılır.
+
+        Her kayıt tek bir başlık ve tek bir paragraftan oluşur, stiller bir kez tanımlanır.
+        split_by_product=True ise her ürünün değerlendirmeleri ayrı dosyaya, max_items_per_file
+        verilirse bir dosya dolduğunda sıradaki dosyaya yazılır. Oluşturulan dosya adlarını döner.
+        """
+        if not self.keep_in_memory:
+            print("Kayıtlar bellekte tutulmadı (keep_in_memory=False); veriler sink dosyalarında")
+            return []
+
+        has_reviews = len(self.reviews) > 0
+        if not has_reviews and not len(self.comments) > 0:
+            print("Henüz veri çekilmedi!")
+            return []
+
+        if has_reviews:
+            products_dict = self._group_reviews_by_product()
+            groups = [(name, products_dict[name]) for name in sorted(products_dict.keys())]
+            total = len(self.reviews)
+        else:
+            groups = [(None, self.comments)]
+            total = len(self.comments)
+
+        root, ext = os.path.splitext(filename)
+        ext = ext or '.docx'
+        created = []
+        writer = None
+        part = 0
+        items_in_file = 0
+
+        product_stems = {}
+        used_stems = set()
+
+        def product_stem(product_name):
+            # Temizlenen adlar çakışabilir ("Kılıf 6/7" ve "Kılıf 67"); çakışanlara sıra numarası eklenir
+            if product_name not in product_stems:
+                base = "".join(c for c in product_name if c.isalnum() or c in (' ', '-', '_'))[:50].strip() or 'urun'
+                stem, counter = base, 1
+                while stem.casefold() in used_stems:
+                    counter += 1
+                    stem = f"{base}_{counter}"
+                used_stems.add(stem.casefold())
+                product_stems[product_name] = stem
+            return product_stems[product_name]
+
+        def open_writer(product_name):
+            suffix = ''
+            if split_by_product and product_name is not None:
+                suffix += '_' + product_stem(product_name)
+            if max_items_per_file:
+                suffix += f'_{part:03d}'
+
+            new_writer = DocxStreamWriter(f"{root}{suffix}{ext}")
+            created.append(new_writer.filename)
+
+            new_writer.heading('Trendyol Ürün Değerlendirmeleri' if has_reviews else 'Trendyol Ürün Yorumları', 0)
+            new_writer.heading('Ürün Bilgileri', 1)
+            new_writer.fields([(f"{key.capitalize()}: ", value) for key, value in self.product_info.items()], style=None)
+
+            if has_reviews:
+                new_writer.heading(f'Toplam Değerlendirme Sayısı: {total}', 2)
+                new_writer.heading('Değerlendirmeler (Ürünlere Göre Alfabetik)', 1)
+            else:
+                new_writer.heading(f'Toplam Yorum Sayısı: {total}', 2)
+                new_writer.heading('Yorumlar', 1)
+            return new_writer
+
+        for product_name, items in groups:
+            if split_by_product and writer:
+                writer.close()
+                writer = None
+                part = 0
+
+            group_header_written = False
+
+            for idx, item in enumerate(items, 1):
+                if writer is None or (max_items_per_file and items_in_file >= max_items_per_file):
+                    if writer:
+                        writer.close()
+                    part += 1
+                    writer = open_writer(product_name)
+                    items_in_file = 0
+                    group_header_written = False
+
+                if product_name is not None and not group_header_written:
+                    writer.heading(f'📦 {product_name}', 2)
+                    writer.paragraph(f'Bu ürüne ait {len(items)} değerlendirme')
+                    group_header_written = True
+
+                if product_name is not None:
+                    writer.heading(f'Değerlendirme #{idx}', 3)
+                    writer.fields([
+                        ('Satıcı: ', item.get('seller', 'Bilinmiyor')),
+                        ('Kullanıcı: ', item.get('name', 'Anonim')),
+                        ('Tarih: ', item.get('date', 'Bilinmiyor')),
+                        ('Değerlendirme: ', '\n' + item.get('comment', '')),
+                    ])
+                else:
+                    writer.heading(f'Yorum #{idx}', 2)
+                    writer.fields([
+                        ('Kullanıcı: ', item.get('user', 'Anonim')),
+                        ('Tarih: ', item.get('date', 'Bilinmiyor')),
+                        ('Yorum: ', '\n' + item.get('comment', '')),
+                    ])
+
+                items_in_file += 1
+
+            if product_name is not None and writer and not split_by_product:
+                writer.page_break()
+
+        if writer:
+            writer.close()
+
+        for created_file in created:
+            print(f"Word dosyası oluşturuldu: {created_file}")
+        return created
+
+    @timed_phase('export')
     def export_to_word(self, filename="trendyol_yorumlar.docx"):
+        if not self.keep_in_memory:
+            print("Kayıtlar bellekte tutulmadı (keep_in_memory=False); veriler sink dosyalarında")
+            return
+
         has_reviews = len(self.reviews) > 0
         has_comments = len(self.comments) > 0
 
@@ -572,12 +1915,7 @@ class TrendyolScraper:
             doc.add_heading(f'Toplam Değerlendirme Sayısı: {len(self.reviews)}', level=2)
             doc.add_paragraph()
 
-            products_dict = {}
-            for review in self.reviews:
-                product_name = review.get('product', 'Bilinmiyor')
-                if product_name not in products_dict:
-                    products_dict[product_name] = []
-                products_dict[product_name].append(review)
+            products_dict = self._group_reviews_by_product()
 
             sorted_products = sorted(products_dict.keys())
 
@@ -638,74 +1976,109 @@ class TrendyolScraper:
         doc.save(filename)
         print(f"Word dosyası oluşturuldu: {filename}")
 
-    def export_to_pdf(self, filename="trendyol_yorumlar.pdf"):
-        if not self.comments:
-            print("Henüz yorum çekilmedi!")
-            return
+    @timed_phase('export')
+    def export_to_pdf(self, filename="trendyol_yorumlar.pdf", workers=1, chunk_size=2000):
+        """Yorumları veya mağaza değerlendirmelerini PDF'e yazar.
 
-        doc = SimpleDocTemplate(filename, pagesize=A4)
-        story = []
-        styles = getSampleStyleSheet()
-
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=black,
-            spaceAfter=30,
-            alignment=TA_LEFT
-        )
-
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=black,
-            spaceAfter=12,
-            spaceBefore=12
-        )
-
-        normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=styles['Normal'],
-            fontSize=11,
-            leading=14,
-            alignment=TA_LEFT
-        )
-
-        story.append(Paragraph("Trendyol Ürün Yorumları", title_style))
-        story.append(Spacer(1, 0.2*inch))
+        workers > 1 verilirse büyük çıktılar chunk_size'lık parçalar halinde paralel çizilip birleştirilir
+        (pypdf gerekir, yoksa tek süreçte çizilir).
+        """
+        if not self.keep_in_memory:
+            print("Kayıtlar bellekte tutulmadı (keep_in_memory=False); veriler sink dosyalarında")
+            return
 
-        story.append(Paragraph("Ürün Bilgileri", heading_style))
-        for key, value in self.product_info.items():
-            text = f"<b>{key.capitalize()}:</b> {value}"
-            story.append(Paragraph(text, normal_style))
+        if len(self.reviews) > 0:
+            export_pdf(filename, self.product_info, list(self.reviews), 'reviews', workers=workers, chunk_size=chunk_size)
+        elif len(self.comments) > 0:
+            export_pdf(filename, self.product_info, list(self.comments), 'comments', workers=workers, chunk_size=chunk_size)
+        else:
+            print("Henüz yorum çekilmedi!")
+            return
 
-        story.append(Spacer(1, 0.2*inch))
-        story.append(Paragraph(f"<b>Toplam Yorum Sayısı:</b> {len(self.comments)}", normal_style))
-        story.append(Spacer(1, 0.3*inch))
-        story.append(Paragraph("Yorumlar", heading_style))
-        story.append(Spacer(1, 0.2*inch))
+        print(f"PDF dosyası oluşturuldu: {filename}")
 
-        for idx, comment in enumerate(self.comments, 1):
-            story.append(Paragraph(f"<b>Yorum #{idx}</b>", heading_style))
+    def _columnar_source(self):
+        if not self.keep_in_memory:
+            print("Kayıtlar bellekte tutulmadı (keep_in_memory=False); veriler sink dosyalarında")
+            return None
+        if len(self.reviews) > 0:
+            return self.reviews.records, 'reviews'
+        if len(self.comments) > 0:
+            return self.comments.records, 'comments'
+        print("Henüz yorum çekilmedi!")
+        return None
+
+    @timed_phase('export')
+    def export_to_parquet(self, filename="trendyol_yorumlar.parquet", row_group_size=50000, compression='zstd'):
+        """Kayıtları tipli sütunlarla Parquet'e yazar (satıcı/ürün adları sözlük kodlu, pyarrow gerekir)"""
+        source = self._columnar_source()
+        if source is None:
+            return
 
-            text = f"<b>Kullanıcı:</b> {comment.get('user', 'Anonim')}"
-            story.append(Paragraph(text, normal_style))
+        export_parquet(filename, self.product_info, source[0], source[1], url=self.metrics.url,
+                       row_group_size=row_group_size, compression=compression)
+        print(f"Parquet dosyası oluşturuldu: {filename}")
 
-            text = f"<b>Tarih:</b> {comment.get('date', 'Bilinmiyor')}"
-            story.append(Paragraph(text, normal_style))
+    @timed_phase('export')
+    def export_to_arrow(self, filename="trendyol_yorumlar.arrow", row_group_size=50000):
+        """Kayıtları Arrow IPC (Feather v2) dosyasına yazar"""
+        source = self._columnar_source()
+        if source is None:
+            return
 
-            comment_text = comment.get('comment', '').replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            text = f"<b>Yorum:</b> {comment_text}"
-            story.append(Paragraph(text, normal_style))
+        export_ipc(filename, self.product_info, source[0], source[1], url=self.metrics.url, row_group_size=row_group_size)
+        print(f"Arrow dosyası oluşturuldu: {filename}")
+
+    @timed_phase('export')
+    def append_to_dataset(self, root="trendyol_dataset", product_key=None, row_group_size=50000, compression='zstd'):
+        """Kayıtları scrape_mode/product_key bölümlü Parquet veri kümesine yeni dosya olarak ekler; yazılan yolu döner"""
+        source = self._columnar_source()
+        if source is None:
+            return None
+
+        path = append_to_dataset(root, self.product_info, source[0], source[1], url=self.metrics.url, key=product_key,
+                                 row_group_size=row_group_size, compression=compression)
+        print(f"Veri kümesine eklendi: {path}")
+        return path
+
+
+def scrape_many(urls, workers=2, mode='comments', max_comments=None, headless=True, **scraper_options):
+    """Birden fazla ürünü sınırlı sayıda tarayıcı işçisiyle paralel çeker.
+
+    urls elemanları URL metni ya da {'url', 'scrape_mode', 'max_comments'} sözlüğü olabilir;
+    sözlükteki değerler mode/max_comments varsayılanlarını ezer. Her işçi havuzdan kendine ait
+    bir Chrome oturumu alır. Sonuçlar tamamlanma sırasıyla üretilir:
+    {'url', 'success', 'result' veya 'error', 'elapsed', 'scraper'}
+    """
+    jobs = []
+    for item in urls:
+        job = dict(item) if isinstance(item, dict) else {'url': item}
+        job.setdefault('scrape_mode', mode)
+        job.setdefault('max_comments', max_comments)
+        jobs.append(job)
+
+    driver_factory = TrendyolScraper(headless=headless, **scraper_options).create_driver
+    with BrowserPool(headless=headless, size=workers, driver_factory=driver_factory) as pool:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_scrape_job, job, pool, headless, scraper_options) for job in jobs]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def _scrape_job(job, pool, headless, scraper_options):
+    start = time.time()
+    scraper = TrendyolScraper(headless=headless, max_comments=job['max_comments'], pool=pool, **scraper_options)
+    record = {'url': job['url'], 'scrape_mode': job['scrape_mode'], 'scraper': scraper}
 
-            story.append(Spacer(1, 0.2*inch))
-            story.append(Paragraph("_" * 100, normal_style))
-            story.append(Spacer(1, 0.2*inch))
+    try:
+        record['result'] = scraper.scrape_product(job['url'], scrape_mode=job['scrape_mode'])
+        record['success'] = True
+    except Exception as e:
+        record['error'] = str(e)
+        record['success'] = False
 
-        doc.build(story)
-        print(f"PDF dosyası oluşturuldu: {filename}")
+    record['elapsed'] = time.time() - start
+    return record
 
 
 def main():
@@ -722,10 +2095,12 @@ def main():
     max_comments_input = input(f"Maksimum kaç {data_type} çekmek istersiniz? (Tümü için Enter'a basın): ").strip()
     max_comments = int(max_comments_input) if max_comments_input else None
 
-    scraper = TrendyolScraper(headless=False, max_comments=max_comments)  # headless=True yaparak arka planda çalıştırabilirsiniz
+    force_refresh = input("Önbellek yok sayılıp yeniden çekilsin mi? (e/H): ").strip().lower() == 'e'
+
+    scraper = TrendyolScraper(headless=False, max_comments=max_comments, cache=ResultCache())  # headless=True yaparak arka planda çalıştırabilirsiniz
 
     try:
-        result = scraper.scrape_product(url, scrape_mode=scrape_mode)
+        result = scraper.scrape_product(url, scrape_mode=scrape_mode, force_refresh=force_refresh)
 
         print(f"\n{'='*50}")
         print(f"Ürün: {result['product_info'].get('name', 'Bilinmiyor')}")